@@ -0,0 +1,37 @@
+"""Server-side item_stat_history timestamp and BRIN index
+
+Revision ID: 0c7e4b2a9d53
+Revises: f9a3c58d2e16
+Create Date: 2026-10-16 16:11:47.205318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c7e4b2a9d53'
+down_revision: Union[str, Sequence[str], None] = 'f9a3c58d2e16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('item_stat_history', 'timestamp',
+               existing_type=sa.DateTime(),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
+    op.create_index('ix_item_stat_history_timestamp_brin', 'item_stat_history', ['timestamp'],
+                    unique=False, postgresql_using='brin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_item_stat_history_timestamp_brin', table_name='item_stat_history', postgresql_using='brin')
+    op.alter_column('item_stat_history', 'timestamp',
+               existing_type=sa.DateTime(),
+               server_default=None,
+               existing_nullable=False)
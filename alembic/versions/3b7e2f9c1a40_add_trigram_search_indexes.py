@@ -0,0 +1,41 @@
+"""Add trigram search indexes
+
+Revision ID: 3b7e2f9c1a40
+Revises: ace912da847b
+Create Date: 2026-10-16 09:14:27.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2f9c1a40'
+down_revision: Union[str, Sequence[str], None] = 'ace912da847b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ILIKE '%term%' searches can only use GIN trigram indexes
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_rfid_tags_id_trgm', 'rfid_tags', ['id'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'id': 'gin_trgm_ops'})
+    op.create_index('ix_partitions_id_trgm', 'partitions', ['id'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'id': 'gin_trgm_ops'})
+    op.create_index('ix_items_name_trgm', 'items', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_storage_sections_id_trgm', 'storage_sections', ['id'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'id': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_storage_sections_id_trgm', table_name='storage_sections')
+    op.drop_index('ix_items_name_trgm', table_name='items')
+    op.drop_index('ix_partitions_id_trgm', table_name='partitions')
+    op.drop_index('ix_rfid_tags_id_trgm', table_name='rfid_tags')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,39 @@
+"""Provision partition and RFID tag id sequences
+
+Revision ID: 3e8b5d1f7c20
+Revises: 0c7e4b2a9d53
+Create Date: 2026-10-16 16:24:09.583104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8b5d1f7c20'
+down_revision: Union[str, Sequence[str], None] = '0c7e4b2a9d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# sequence -> (table, id prefix)
+SEQUENCES = {'partitions_seq': ('partitions', 'P'), 'rfid_seq': ('rfid_tags', 'RF')}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for seq, (table, prefix) in SEQUENCES.items():
+        # the id listeners used to create these lazily; keep them at or past the highest issued id
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {seq} START 1")
+        op.execute(
+            f"SELECT setval('{seq}', m) FROM ("
+            f"SELECT max(substring(id FROM {len(prefix) + 1})::bigint) AS m FROM {table} WHERE id ~ '^{prefix}[0-9]+$'"
+            f") s WHERE m IS NOT NULL AND m >= (SELECT last_value FROM {seq})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # nothing to undo: older code creates the same sequences on demand
+    pass
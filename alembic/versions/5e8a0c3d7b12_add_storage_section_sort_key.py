@@ -0,0 +1,46 @@
+"""Add storage section sort key
+
+Revision ID: 5e8a0c3d7b12
+Revises: 9d4c6a1e8f25
+Create Date: 2026-10-16 11:27:09.562318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a0c3d7b12'
+down_revision: Union[str, Sequence[str], None] = '9d4c6a1e8f25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('storage_sections', sa.Column('sort_key', sa.String(length=32), nullable=True))
+    # backfill with the same formula as StorageSection.generate_sort_key
+    op.execute(
+        """
+        UPDATE storage_sections SET sort_key =
+            lpad(substring(floor from 2), 5, '0')
+            || lpad(substring(cabinet from 2), 5, '0')
+            || lpad(substring(layer from 2), 5, '0')
+            || CASE color::text
+                   WHEN 'RED' THEN '1'
+                   WHEN 'GREEN' THEN '2'
+                   WHEN 'BLUE' THEN '3'
+                   WHEN 'YELLOW' THEN '4'
+                   ELSE '5'
+               END
+        """
+    )
+    op.create_index(op.f('ix_storage_sections_sort_key'), 'storage_sections', ['sort_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_storage_sections_sort_key'), table_name='storage_sections')
+    op.drop_column('storage_sections', 'sort_key')
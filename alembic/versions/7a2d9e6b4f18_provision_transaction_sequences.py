@@ -0,0 +1,39 @@
+"""Provision transaction id sequences
+
+Revision ID: 7a2d9e6b4f18
+Revises: 3e8b5d1f7c20
+Create Date: 2026-10-16 16:37:52.918470
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2d9e6b4f18'
+down_revision: Union[str, Sequence[str], None] = '3e8b5d1f7c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# transaction id type code -> sequence ("T-P12" comes from transactions_seq_p)
+SEQUENCES = {'P': 'transactions_seq_p', 'C': 'transactions_seq_c', 'L': 'transactions_seq_l'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for code, seq in SEQUENCES.items():
+        # the id listener used to create these on every insert; keep them at or past the highest issued id
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {seq} START 1")
+        op.execute(
+            f"SELECT setval('{seq}', m) FROM ("
+            f"SELECT max(substring(id FROM 4)::bigint) AS m FROM transactions WHERE id ~ '^T-{code}[0-9]+$'"
+            f") s WHERE m IS NOT NULL AND m >= (SELECT last_value FROM {seq})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # nothing to undo: older code creates the same sequences on demand
+    pass
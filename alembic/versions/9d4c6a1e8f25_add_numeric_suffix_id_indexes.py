@@ -0,0 +1,37 @@
+"""Add numeric suffix id indexes
+
+Revision ID: 9d4c6a1e8f25
+Revises: 3b7e2f9c1a40
+Create Date: 2026-10-16 10:02:51.774410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c6a1e8f25'
+down_revision: Union[str, Sequence[str], None] = '3b7e2f9c1a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tables listed via app.crud.general.order_by_numeric_suffix
+TABLES = ('partitions', 'rfid_tags', 'items', 'large_items', 'containers', 'transactions')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # expression must stay identical to app.database.numeric_suffix
+    for table in TABLES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_id_numeric_suffix ON {table} "
+            r"((CAST(nullif(regexp_replace(id, '\D', '', 'g'), '') AS BIGINT)), id)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_id_numeric_suffix")
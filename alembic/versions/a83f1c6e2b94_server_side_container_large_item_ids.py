@@ -0,0 +1,45 @@
+"""Server-side container and large item ids
+
+Revision ID: a83f1c6e2b94
+Revises: f2c68a4b1d57
+Create Date: 2026-10-16 15:02:11.604237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a83f1c6e2b94'
+down_revision: Union[str, Sequence[str], None] = 'f2c68a4b1d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (id prefix, sequence)
+TABLES = {
+    'containers': ('C', 'containers_seq'),
+    'large_items': ('L', 'large_items_seq'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, (prefix, seq) in TABLES.items():
+        # the old before_insert listeners created these lazily; make sure they exist and
+        # sit at or past the highest id already issued
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {seq} START 1")
+        op.execute(
+            f"SELECT setval('{seq}', m) FROM ("
+            f"SELECT max(substring(id FROM {len(prefix) + 1})::bigint) AS m FROM {table} WHERE id ~ '^{prefix}[0-9]+$'"
+            f") s WHERE m IS NOT NULL AND m >= (SELECT last_value FROM {seq})"
+        )
+        op.alter_column(table, 'id', server_default=sa.text(f"'{prefix}' || nextval('{seq}')"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # sequences are kept; the application listeners used them before this revision
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,33 @@
+"""Add transaction history indexes
+
+Revision ID: b21f7d4e6c93
+Revises: 5e8a0c3d7b12
+Create Date: 2026-10-16 12:40:18.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b21f7d4e6c93'
+down_revision: Union[str, Sequence[str], None] = '5e8a0c3d7b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ('item_id', 'partition_id', 'container_id', 'large_item_id', 'storage_section_id', 'user_name')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for col in COLUMNS:
+        op.create_index(f'ix_transactions_{col}_date', 'transactions',
+                        [col, sa.text('transaction_date DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for col in COLUMNS:
+        op.drop_index(f'ix_transactions_{col}_date', table_name='transactions')
@@ -0,0 +1,43 @@
+"""Add composite status indexes
+
+Revision ID: b6d19f4e0a72
+Revises: d5e0b7a3c421
+Create Date: 2026-10-16 15:42:06.371258
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d19f4e0a72'
+down_revision: Union[str, Sequence[str], None] = 'd5e0b7a3c421'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# new composite index -> (table, columns, single-column indexes it replaces)
+INDEXES = {
+    'ix_containers_item_status': ('containers', ['item_id', 'status'], ['ix_containers_item_id', 'ix_containers_status']),
+    'ix_containers_section_status': ('containers', ['storage_section_id', 'status'], ['ix_containers_storage_section_id']),
+    'ix_large_items_section_status': ('large_items', ['storage_section_id', 'status'], ['ix_large_items_storage_section_id', 'ix_large_items_status']),
+    'ix_item_stat_history_item_ts': ('item_stat_history', ['item_id', 'timestamp'], ['ix_item_stat_history_item_id']),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, (table, columns, replaced) in INDEXES.items():
+        op.create_index(name, table, columns, unique=False)
+        for old in replaced:
+            op.drop_index(old, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, columns, replaced) in INDEXES.items():
+        for old in replaced:
+            # the old single-column indexes are all named ix_<table>_<column>
+            op.create_index(old, table, [old[len(f'ix_{table}_'):]], unique=False)
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,37 @@
+"""Server-side partition and RFID tag ids
+
+Revision ID: c1f4a7e2d935
+Revises: 7a2d9e6b4f18
+Create Date: 2026-10-16 16:52:13.406781
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1f4a7e2d935'
+down_revision: Union[str, Sequence[str], None] = '7a2d9e6b4f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (id prefix, sequence); the sequences were provisioned by 3e8b5d1f7c20
+TABLES = {
+    'partitions': ('P', 'partitions_seq'),
+    'rfid_tags': ('RF', 'rfid_seq'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, (prefix, seq) in TABLES.items():
+        op.alter_column(table, 'id', server_default=sa.text(f"'{prefix}' || nextval('{seq}')"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # sequences are kept; the application assigned ids from them before this revision
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,32 @@
+"""Add rfid tag assigned partial indexes
+
+Revision ID: c4a91e2d7f36
+Revises: b21f7d4e6c93
+Create Date: 2026-10-16 13:05:42.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a91e2d7f36'
+down_revision: Union[str, Sequence[str], None] = 'b21f7d4e6c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_rfid_tags_assigned', 'rfid_tags', ['id'], unique=False,
+                    postgresql_where=sa.text('assigned = true'))
+    op.create_index('ix_rfid_tags_unassigned', 'rfid_tags', ['id'], unique=False,
+                    postgresql_where=sa.text('assigned = false'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rfid_tags_unassigned', table_name='rfid_tags')
+    op.drop_index('ix_rfid_tags_assigned', table_name='rfid_tags')
@@ -0,0 +1,39 @@
+"""Provision item stat history sequences
+
+Revision ID: d5e0b7a3c421
+Revises: a83f1c6e2b94
+Create Date: 2026-10-16 15:20:48.117902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e0b7a3c421'
+down_revision: Union[str, Sequence[str], None] = 'a83f1c6e2b94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# history id type code -> sequence ("ISH-P12" comes from ish_p_seq)
+SEQUENCES = {'P': 'ish_p_seq', 'C': 'ish_c_seq', 'L': 'ish_l_seq'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for code, seq in SEQUENCES.items():
+        # the id listener used to create these lazily; keep them at or past the highest issued id
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {seq} START 1")
+        op.execute(
+            f"SELECT setval('{seq}', m) FROM ("
+            f"SELECT max(substring(id FROM 6)::bigint) AS m FROM item_stat_history WHERE id ~ '^ISH-{code}[0-9]+$'"
+            f") s WHERE m IS NOT NULL AND m >= (SELECT last_value FROM {seq})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # nothing to undo: older code creates the same sequences on demand
+    pass
@@ -0,0 +1,42 @@
+"""Add partition and large item composite status indexes
+
+Revision ID: e2b8c4d6a1f3
+Revises: c1f4a7e2d935
+Create Date: 2026-10-16 17:08:25.734190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8c4d6a1f3'
+down_revision: Union[str, Sequence[str], None] = 'c1f4a7e2d935'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# new composite index -> (table, columns, single-column indexes it replaces)
+INDEXES = {
+    'ix_partitions_item_status': ('partitions', ['item_id', 'status'], ['ix_partitions_item_id', 'ix_partitions_status']),
+    'ix_partitions_section_status': ('partitions', ['storage_section_id', 'status'], ['ix_partitions_storage_section_id']),
+    'ix_large_items_item_status': ('large_items', ['item_id', 'status'], ['ix_large_items_item_id']),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, (table, columns, replaced) in INDEXES.items():
+        op.create_index(name, table, columns, unique=False)
+        for old in replaced:
+            op.drop_index(old, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, columns, replaced) in INDEXES.items():
+        for old in replaced:
+            # the old single-column indexes are all named ix_<table>_<column>
+            op.create_index(old, table, [old[len(f'ix_{table}_'):]], unique=False)
+        op.drop_index(name, table_name=table)
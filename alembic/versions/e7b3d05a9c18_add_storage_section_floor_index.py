@@ -0,0 +1,28 @@
+"""Add storage section floor index
+
+Revision ID: e7b3d05a9c18
+Revises: c4a91e2d7f36
+Create Date: 2026-10-16 13:21:07.542911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d05a9c18'
+down_revision: Union[str, Sequence[str], None] = 'c4a91e2d7f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_storage_sections_floor'), 'storage_sections', ['floor'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_storage_sections_floor'), table_name='storage_sections')
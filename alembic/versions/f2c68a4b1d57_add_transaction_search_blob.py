@@ -0,0 +1,38 @@
+"""Add transaction search blob
+
+Revision ID: f2c68a4b1d57
+Revises: e7b3d05a9c18
+Create Date: 2026-10-16 13:48:26.170394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c68a4b1d57'
+down_revision: Union[str, Sequence[str], None] = 'e7b3d05a9c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# must stay identical to Transaction.search_blob; chr(31) separators keep matches within one field
+SEARCH_BLOB_SQL = (
+    "lower(coalesce(item_id, '') || chr(31) || coalesce(item_name, '') || chr(31) || coalesce(partition_id, '') || chr(31) || "
+    "coalesce(large_item_id, '') || chr(31) || coalesce(container_id, '') || chr(31) || coalesce(user_name, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # stored generated column; adding it rewrites the transactions table once
+    op.add_column('transactions', sa.Column('search_blob', sa.Text(), sa.Computed(SEARCH_BLOB_SQL, persisted=True), nullable=True))
+    op.create_index('ix_transactions_search_blob_trgm', 'transactions', ['search_blob'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'search_blob': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_search_blob_trgm', table_name='transactions')
+    op.drop_column('transactions', 'search_blob')
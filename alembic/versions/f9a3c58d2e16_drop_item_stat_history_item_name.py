@@ -0,0 +1,33 @@
+"""Drop item_stat_history.item_name
+
+Revision ID: f9a3c58d2e16
+Revises: b6d19f4e0a72
+Create Date: 2026-10-16 15:58:31.640925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f9a3c58d2e16'
+down_revision: Union[str, Sequence[str], None] = 'b6d19f4e0a72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # history rows cascade with their item, so the name is always available from items
+    op.drop_column('item_stat_history', 'item_name')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('item_stat_history', sa.Column('item_name', sa.String(length=255), nullable=True))
+    op.execute(
+        "UPDATE item_stat_history h SET item_name = i.name FROM items i WHERE i.id = h.item_id"
+    )
+    op.alter_column('item_stat_history', 'item_name', nullable=False)
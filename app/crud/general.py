@@ -1,17 +1,19 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from sqlalchemy import BigInteger
+from sqlalchemy import func, insert, literal, tuple_
 from app.models.item import Item, ItemType
 from app.models.storage_section import StorageSection
 from app.models.rfid_tag import RFIDTag
-from typing import Optional, TypeVar, Type, Dict, Any
+from typing import List, Optional, TypeVar, Type, Dict, Any
+from app.database import numeric_suffix
+from app.id_alloc import sequence_id_expressions
 
 EntityModel = TypeVar('EntityModel')
 
 
-def _validate_item_type(db: Session, item_id: str, expected_type: ItemType) -> Item:
-    """Validate item exists and has correct type"""
-    item = db.query(Item).filter(Item.id == item_id).first()
+def _validate_item_type(db: Session, item_id: str, expected_type: ItemType, item: Optional[Item] = None) -> Item:
+    """Validate item exists and has correct type (pass `item` if the caller already loaded it)"""
+    if item is None:
+        item = db.query(Item).filter(Item.id == item_id).first()
     if not item:
         raise ValueError({"field": "item_id", "message": f"Item with ID '{item_id}' not found"})
     if item.item_type != expected_type:
@@ -21,7 +23,7 @@ def _validate_item_type(db: Session, item_id: str, expected_type: ItemType) -> I
 
 def _validate_storage_section_exists(db: Session, storage_section_id: str) -> StorageSection:
     """Validate storage section exists"""
-    storage_section = db.query(StorageSection).filter(StorageSection.id == storage_section_id).first()
+    storage_section = db.get(StorageSection, storage_section_id)
     if not storage_section:
         raise ValueError({"field": "storage_section_id", "message": f"Storage section '{storage_section_id}' not found"})
     return storage_section
@@ -53,11 +55,12 @@ def create_entity_with_rfid_and_storage(
     item_id: str,
     storage_section_id: str,
     rfid_tag_id: str,
-    expected_item_type: ItemType
+    expected_item_type: ItemType,
+    item: Optional[Item] = None
 ) -> EntityModel:
     """Generic function to create entity with RFID and storage section management"""
     try:
-        _validate_item_type(db, item_id, expected_item_type)
+        _validate_item_type(db, item_id, expected_item_type, item)
         _validate_storage_section_exists(db, storage_section_id)
         _assign_rfid_tag(db, rfid_tag_id)
 
@@ -145,8 +148,47 @@ def order_by_numeric_suffix(query, column, asc=False):
     Order SQLAlchemy query by the numeric suffix of `column` (Postgres).
     Usage: query = order_by_numeric_suffix(query, Model.id, asc=False)
     """
-    # regexp_replace(..., '\D', '', 'g') -> digits only ('' if none)
-    numeric_part = func.nullif(func.regexp_replace(column, r'\D', '', 'g'), '').cast(BigInteger)
+    numeric_part = numeric_suffix(column)
     if asc:
         return query.order_by(numeric_part.asc(), column.asc())
     return query.order_by(numeric_part.desc(), column.desc())
+
+
+def filter_after_numeric_suffix(query, column, after: str, asc=False):
+    """
+    Keyset filter matching order_by_numeric_suffix: keep only rows that sort after the `after` id.
+    Usage: query = filter_after_numeric_suffix(query, Model.id, cursor, asc=False)
+    """
+    # compare (numeric_part, id) as a row value so the cursor matches the sort key exactly
+    key = tuple_(numeric_suffix(column), column)
+    cursor = tuple_(numeric_suffix(literal(after)), literal(after))
+    return query.filter(key > cursor if asc else key < cursor)
+
+
+def paginate_with_total(query, page: int, page_size: int):
+    """
+    Fetch one OFFSET page plus the total match count in a single round-trip (COUNT(*) OVER ()).
+    Returns (rows, total_count). Ordering must already be applied to `query`.
+    """
+    return offset_with_total(query, (page - 1) * page_size, page_size)
+
+
+def offset_with_total(query, skip: int, limit: int):
+    """Same as paginate_with_total but takes a raw skip/limit window"""
+    rows = query.add_columns(func.count().over().label("_total")).offset(skip).limit(limit).all()
+    if rows:
+        return [r[0] for r in rows], rows[0]._total
+    # past the last page the window has no row to ride on; fall back to a plain count
+    return [], (query.order_by(None).count() if skip > 0 else 0)
+
+
+def bulk_create(db: Session, model: Type[EntityModel], rows: List[Dict[str, Any]]) -> List[EntityModel]:
+    """
+    Insert many rows in one round trip: a single multi-row INSERT ... RETURNING whose ids come
+    from the model's sequence inside the statement, or from its server default. This is a Core
+    insert: callers must do any validation/side effects themselves (RFID assignment, stat updates).
+    """
+    if not rows:
+        return []
+    sequence_id_expressions(model, rows)
+    return db.scalars(insert(model).values(rows).returning(model)).all()
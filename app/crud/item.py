@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, and_, distinct, or_
 from app.models.item import (
     Item,
@@ -114,7 +114,6 @@ def _maybe_record_stat_history(db: Session, stat_obj, changed_keys: list, change
 
     hist = ItemStatHistory(
         item_id=item_row.id,
-        item_name=item_row.name,
         item_type=item_row.item_type,
         total_quantity=payload.get("total_quantity"),
         total_capacity=payload.get("total_capacity"),
@@ -129,11 +128,15 @@ def _stat_status_value(stat_row):
 
 # -- status updaters --
 def _update_partition_status(db: Session, item_id: str, change_source: Optional[str] = None) -> None:
-    ps = db.query(PartitionStat).filter(PartitionStat.item_id == item_id).first()
-    if not ps:
+    # stat row and partition aggregates in one round-trip
+    partition_count_sq = db.query(func.count(Partition.id)).filter(Partition.item_id == item_id).scalar_subquery()
+    total_quantity_sq = db.query(func.coalesce(func.sum(Partition.quantity), 0)).filter(Partition.item_id == item_id).scalar_subquery()
+    row = db.query(PartitionStat, partition_count_sq, total_quantity_sq).filter(PartitionStat.item_id == item_id).first()
+    if not row:
         return
-    partition_count = db.query(func.count(Partition.id)).filter(Partition.item_id == item_id).scalar() or 0
-    total_quantity = db.query(func.coalesce(func.sum(Partition.quantity), 0)).filter(Partition.item_id == item_id).scalar() or 0
+    ps, partition_count, total_quantity = row
+    partition_count = partition_count or 0
+    total_quantity = total_quantity or 0
     per_capacity = int(ps.partition_capacity) if ps.partition_capacity else 0
     total_capacity = int(partition_count) * per_capacity
     percent = (total_quantity / total_capacity) * 100.0 if total_capacity > 0 else 0.0
@@ -195,19 +198,19 @@ def _to_dict_safe(pydantic_obj):
         except Exception:
             return pydantic_obj
 
-def create_item_response(db: Session, item: Item, base_url: str = "") -> ItemResponse:
-
-    try:
-        db.refresh(item)
-    except Exception:
-        pass
+def create_item_response(db: Session, item: Item, base_url: str = "", refresh: bool = True) -> ItemResponse:
+    # list endpoints pass refresh=False: their items were just queried with_stats
+    if refresh:
+        try:
+            db.refresh(item)
+        except Exception:
+            pass
 
     image_url = get_image_url(item.id, base_url) if item.image_path else None
 
     partition_stat = None
     largeitem_stat = None
     container_stat = None
-    partitions_list = None
 
     if getattr(item, "partition_stat", None):
         ps = item.partition_stat
@@ -241,20 +244,7 @@ def create_item_response(db: Session, item: Item, base_url: str = "") -> ItemRes
             "stock_status": _stat_status_value(cs)
         }
 
-    if item.item_type == ItemType.PARTITION:
-        query = db.query(Partition).filter(Partition.item_id == item.id)
-        query = order_by_numeric_suffix(query, Partition.id)
-        partitions = query.all()
-        partitions_list = [
-            {
-                "id": p.id,
-                "storage_section_id": p.storage_section_id,
-                "rfid_tag_id": p.rfid_tag_id,
-                "quantity": p.quantity,
-                "status": getattr(getattr(p, "status", None), "value", p.status)
-            } for p in partitions
-        ]
-
+    # ItemResponse has no partitions field, so the item's partition rows are not loaded here
     return ItemResponse.model_validate({
         "id": item.id,
         "name": item.name,
@@ -270,35 +260,59 @@ def create_item_response(db: Session, item: Item, base_url: str = "") -> ItemRes
         "partition_stat": partition_stat,
         "largeitem_stat": largeitem_stat,
         "container_stat": container_stat,
-        "partitions": partitions_list,
     })
 
-def build_item_with_stats(db: Session, item: Item, base_url: str) -> ItemStatsResponse:
-    item_response = create_item_response(db, item, base_url)
+def _unit_counts_by_item(db: Session, items: List[Item]) -> Dict[str, int]:
+    """Partition / container counts for many items, one grouped COUNT query per unit table"""
+    counts: Dict[str, int] = {}
+    for item_type, model in ((ItemType.PARTITION, Partition), (ItemType.CONTAINER, Container)):
+        ids = [item.id for item in items if item.item_type == item_type]
+        if ids:
+            counts.update(
+                db.query(model.item_id, func.count(model.id))
+                .filter(model.item_id.in_(ids))
+                .group_by(model.item_id)
+                .all()
+            )
+    return counts
+
+def build_item_with_stats(db: Session, item: Item, base_url: str, refresh: bool = True, unit_count: Optional[int] = None) -> ItemStatsResponse:
+    item_response = create_item_response(db, item, base_url, refresh=refresh)
     base_data = _to_dict_safe(item_response)
+    if unit_count is None and item.item_type in (ItemType.PARTITION, ItemType.CONTAINER):
+        unit_count = _unit_counts_by_item(db, [item]).get(item.id, 0)
 
+    # stat rows come from the item's relationships (batch-loaded by with_stats on list pages)
     stats = {}
     if item.item_type == ItemType.PARTITION:
-        p = get_partition_stats(db, item.id)
-        ps_row = db.query(PartitionStat).filter(PartitionStat.item_id == item.id).first()
         stats = {
-            "partition_count": p.get("partition_count", 0),
-            "stock_status": _stat_status_value(ps_row)
+            "partition_count": unit_count,
+            "stock_status": _stat_status_value(item.partition_stat)
         }
     elif item.item_type == ItemType.LARGE_ITEM:
-        ls = db.query(LargeItemStat).filter(LargeItemStat.item_id == item.id).first()
-        stats = {"stock_status": _stat_status_value(ls)}
+        stats = {"stock_status": _stat_status_value(item.largeitem_stat)}
     elif item.item_type == ItemType.CONTAINER:
-        c = get_container_stats(db, item.id)
-        cs = db.query(ContainerStat).filter(ContainerStat.item_id == item.id).first()
         stats = {
-            "container_count": c.get("container_count", 0),
-            "stock_status": _stat_status_value(cs)
+            "container_count": unit_count,
+            "stock_status": _stat_status_value(item.container_stat)
         }
 
     merged = {**base_data, **stats}
     return ItemStatsResponse.model_validate(merged)
 
+def build_items_with_stats(db: Session, items: List[Item], base_url: str) -> List[ItemStatsResponse]:
+    """List-page variant of build_item_with_stats: unit counts for the whole page come from grouped queries"""
+    counts = _unit_counts_by_item(db, items)
+    return [build_item_with_stats(db, item, base_url, refresh=False, unit_count=counts.get(item.id, 0)) for item in items]
+
+def with_stats(query):
+    """Batch-load the per-type stat rows (one IN query each) for list endpoints that serialize them"""
+    return query.options(
+        selectinload(Item.partition_stat),
+        selectinload(Item.largeitem_stat),
+        selectinload(Item.container_stat),
+    )
+
 def get_item(db: Session, item_id: str) -> Optional[Item]:
     return db.query(Item).filter(Item.id == item_id).first()
 
@@ -353,7 +367,7 @@ def get_items(
     query = order_by_numeric_suffix(query, Item.id)
     total_count = query.count()
     skip = (page - 1) * page_size
-    items = query.offset(skip).limit(page_size).all()
+    items = with_stats(query).offset(skip).limit(page_size).all()
     return items, total_count
 
 def _create_initial_stat_for_item(db: Session, db_item: Item, data: dict) -> None:
@@ -701,13 +715,13 @@ def delete_item(db: Session, item_id: str) -> Optional[Item]:
 
 def search_items_by_keyword(db: Session, keyword: str, limit: int = 20) -> List[Item]:
     search_term = f"%{keyword}%"
-    return db.query(Item).filter(or_(Item.id.ilike(search_term), Item.name.ilike(search_term), Item.manufacturer.ilike(search_term))).limit(limit).all()
+    return with_stats(db.query(Item)).filter(or_(Item.id.ilike(search_term), Item.name.ilike(search_term), Item.manufacturer.ilike(search_term))).limit(limit).all()
 
 def get_items_by_type(db: Session, item_type: ItemType) -> List[Item]:
-    return db.query(Item).filter(Item.item_type == item_type).order_by(Item.name).all()
+    return with_stats(db.query(Item)).filter(Item.item_type == item_type).order_by(Item.name).all()
 
 def get_items_by_manufacturer(db: Session, manufacturer: str) -> List[Item]:
-    return db.query(Item).filter(Item.manufacturer.ilike(f"%{manufacturer}%")).order_by(Item.name).all()
+    return with_stats(db.query(Item)).filter(Item.manufacturer.ilike(f"%{manufacturer}%")).order_by(Item.name).all()
 
 def get_item_count(db: Session) -> int:
     return db.query(Item).count()
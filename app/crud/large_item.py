@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import or_, update
 from app.models.large_item import LargeItem, LargeItemStatus
 from app.models.item import Item, ItemType
 from app.models.storage_section import StorageSection
@@ -87,8 +87,23 @@ def create_large_item(db: Session, large_item: LargeItemCreate) -> LargeItem:
         pass
     return created
 
+def update_large_item_status(db: Session, large_item_id: str, status: LargeItemStatus) -> Optional[LargeItem]:
+    """Flip large item status with a single UPDATE ... RETURNING"""
+    updated = db.execute(
+        update(LargeItem)
+        .where(LargeItem.id == large_item_id)
+        .values(status=status)
+        .returning(LargeItem)
+    ).scalar_one_or_none()
+    db.commit()
+    return updated
+
 def update_large_item(db: Session, large_item_id: str, large_item: LargeItemUpdate) -> Optional[LargeItem]:
     update_data = large_item.model_dump(exclude_unset=True)
+
+    # status-only change does not affect item totals; skip the generic select/mutate path
+    if update_data.keys() == {"status"} and update_data["status"] is not None:
+        return update_large_item_status(db, large_item_id, update_data["status"])
     
     updated = update_entity_with_rfid_and_storage(
         db=db,
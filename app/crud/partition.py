@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import or_, select, update, func, lambda_stmt
 from app.models.partition import Partition, PartitionStatus
 from app.models.item import Item, ItemType, PartitionStat
 from app.models.storage_section import StorageSection
@@ -12,20 +12,26 @@ from app.crud.general import (
 from typing import List, Optional, Tuple
 # import updater
 from app.crud.item import _update_partition_status
-from app.crud.general import order_by_numeric_suffix
+from app.crud.general import order_by_numeric_suffix, filter_after_numeric_suffix, paginate_with_total
 
 def get_partition(db: Session, partition_id: str) -> Optional[Partition]:
     """Get partition by ID"""
-    return db.query(Partition).filter(Partition.id == partition_id).first()
+    # lambda_stmt caches the compiled SELECT; only partition_id is bound per call
+    return db.execute(lambda_stmt(lambda: select(Partition).where(Partition.id == partition_id))).scalar_one_or_none()
 
 def get_partitions(
     db: Session, 
     page: int = 1, 
     page_size: int = 10,
     search: Optional[str] = None,
-    status: Optional[PartitionStatus] = None
-) -> Tuple[List[Partition], int]:
-    """Get partitions with pagination and filtering"""
+    status: Optional[PartitionStatus] = None,
+    after: Optional[str] = None
+) -> Tuple[List[Partition], Optional[int], Optional[str]]:
+    """
+    Get partitions with pagination and filtering.
+    Pass `after` (a partition id) for keyset pagination; the total count is skipped in that mode.
+    Returns (partitions, total_count, next_cursor).
+    """
     query = db.query(Partition)
     
     if search:
@@ -43,22 +49,29 @@ def get_partitions(
     
     # order by numeric suffix of id (Postgres). Falls back to string id for deterministic ordering.
     query = order_by_numeric_suffix(query, Partition.id, asc=True)
-    total_count = query.count()
-    
-    skip = (page - 1) * page_size
-    partitions = query.offset(skip).limit(page_size).all()
-    
-    return partitions, total_count
+
+    if after:
+        query = filter_after_numeric_suffix(query, Partition.id, after, asc=True)
+        partitions = query.limit(page_size).all()
+        total_count = None
+    else:
+        partitions, total_count = paginate_with_total(query, page, page_size)
+
+    next_cursor = partitions[-1].id if len(partitions) == page_size else None
+    return partitions, total_count, next_cursor
 
 def create_partition(db: Session, partition: PartitionCreate) -> Partition:
     """Create new partition using generic function"""
     
     # enforce configured partition_capacity (backend source of truth: PartitionStat)
-    from app.models.item import PartitionStat as _PartitionStat
-    ps = db.query(_PartitionStat).filter(_PartitionStat.item_id == partition.item_id).first()
-    if ps and ps.partition_capacity is not None:
+    # load the item and its capacity together; the item is reused for type validation below
+    row = db.query(Item, PartitionStat.partition_capacity).outerjoin(
+        PartitionStat, PartitionStat.item_id == Item.id
+    ).filter(Item.id == partition.item_id).first()
+    item, capacity = row if row else (None, None)
+    if capacity is not None:
         try:
-            cap = int(ps.partition_capacity)
+            cap = int(capacity)
             if partition.quantity is not None and int(partition.quantity) > cap:
                 raise ValueError({"field": "quantity", "message": f"quantity ({partition.quantity}) exceeds partition_capacity ({cap})"})
         except ValueError:
@@ -83,26 +96,76 @@ def create_partition(db: Session, partition: PartitionCreate) -> Partition:
         item_id=partition.item_id,
         storage_section_id=partition.storage_section_id,
         rfid_tag_id=partition.rfid_tag_id,
-        expected_item_type=ItemType.PARTITION
+        expected_item_type=ItemType.PARTITION,
+        item=item
     )
     # ensure stats (including stock_status) are recomputed & persisted
     try:
-        db.refresh(created)
-        _update_partition_status(db, created.item_id, "Register Partition")
-        # refresh the parent Item so response readers see updated partition_stat
-        item = db.query(Item).filter(Item.id == created.item_id).first()
-        if item:
-            db.refresh(item)
+        # created was refreshed by the generic helper; item_id is known from the request
+        # the stat commit expires the session, so readers of item.partition_stat reload it lazily
+        _update_partition_status(db, partition.item_id, "Register Partition")
     except Exception:
         pass
     return created
 
+def update_partition_status(db: Session, partition_id: str, status: PartitionStatus) -> Optional[Partition]:
+    """Flip partition status with a single UPDATE ... RETURNING"""
+    updated = db.execute(
+        update(Partition)
+        .where(Partition.id == partition_id)
+        .values(status=status)
+        .returning(Partition)
+    ).scalar_one_or_none()
+    db.commit()
+    return updated
+
+def update_partition_quantity(db: Session, partition_id: str, new_quantity: int) -> Optional[Partition]:
+    """Set partition quantity with the partition_capacity check folded into the UPDATE"""
+    if new_quantity < 0:
+        raise ValueError({"field": "quantity", "message": "Quantity cannot be negative"})
+
+    capacity = (
+        select(PartitionStat.partition_capacity)
+        .where(PartitionStat.item_id == Partition.item_id)
+        .scalar_subquery()
+    )
+    updated = db.execute(
+        update(Partition)
+        .where(Partition.id == partition_id, func.coalesce(capacity, new_quantity) >= new_quantity)
+        .values(quantity=new_quantity)
+        .returning(Partition)
+    ).scalar_one_or_none()
+
+    if updated is None:
+        # no row matched: either the partition is missing or the capacity check failed
+        db.rollback()
+        current = get_partition(db, partition_id)
+        if not current:
+            return None
+        ps = db.query(PartitionStat).filter(PartitionStat.item_id == current.item_id).first()
+        cap = ps.partition_capacity if ps else None
+        raise ValueError({"field": "quantity", "message": f"quantity ({new_quantity}) exceeds partition_capacity ({cap})"})
+
+    item_id = updated.item_id
+    db.commit()
+    try:
+        _update_partition_status(db, item_id, "Return Partition")
+    except Exception:
+        pass
+    return updated
+
 def update_partition(db: Session, partition_id: str, partition: PartitionUpdate) -> Optional[Partition]:
     """Update partition using generic function"""
     update_data = partition.model_dump(exclude_unset=True)
 
+    # single-column changes don't need the generic select/validate/mutate path
+    if update_data.keys() == {"status"} and update_data["status"] is not None:
+        return update_partition_status(db, partition_id, update_data["status"])
+    if update_data.keys() == {"quantity"} and update_data["quantity"] is not None:
+        return update_partition_quantity(db, partition_id, update_data["quantity"])
+
     # determine final target item_id for this partition after update
-    current = db.query(Partition).filter(Partition.id == partition_id).first()
+    current = get_partition(db, partition_id)
     target_item_id = update_data.get("item_id") if update_data.get("item_id") is not None else (current.item_id if current else None)
     # determine final quantity after update
     target_quantity = update_data.get("quantity") if update_data.get("quantity") is not None else (current.quantity if current else None)
@@ -130,41 +193,38 @@ def update_partition(db: Session, partition_id: str, partition: PartitionUpdate)
     )
     if updated:
         try:
-            db.refresh(updated)
             _update_partition_status(db, updated.item_id, "Return Partition")
-            item = db.query(Item).filter(Item.id == updated.item_id).first()
-            if item:
-                db.refresh(item)
         except Exception:
             pass
     return updated
 
 def delete_partition(db: Session, partition_id: str) -> Optional[Partition]:
     """Delete partition using generic function"""
-    current = db.query(Partition).filter(Partition.id == partition_id).first()
+    current = get_partition(db, partition_id)
     item_id = current.item_id if current else None
     deleted = delete_entity_with_rfid_and_storage(db, Partition, partition_id)
     if deleted and item_id:
         try:
             _update_partition_status(db, item_id, "Partition Consumed")
-            item = db.query(Item).filter(Item.id == item_id).first()
-            if item:
-                db.refresh(item)
         except Exception:
             pass
     return deleted
 
-def get_partitions_by_item(db: Session, item_id: str) -> List[Partition]:
-    """Get partitions by item ID"""
+# The two listings below return the Query itself, not a list: iterating it runs the SELECT and
+# streams rows in batches from a server-side cursor held until iteration ends. Iterate it once
+# while the session is open (the routers build their responses in a single pass); len(),
+# indexing or a second loop would need list(...) first.
+def get_partitions_by_item(db: Session, item_id: str) -> Query:
+    """Get partitions by item ID (streamed in batches from a server-side cursor)"""
     query = db.query(Partition).filter(Partition.item_id == item_id)
     query = order_by_numeric_suffix(query, Partition.id)
-    return query.all()
+    return query.yield_per(500)
 
-def get_partitions_by_storage_section(db: Session, storage_section_id: str) -> List[Partition]:
-    """Get partitions by storage section ID"""
+def get_partitions_by_storage_section(db: Session, storage_section_id: str) -> Query:
+    """Get partitions by storage section ID (streamed in batches from a server-side cursor)"""
     query = db.query(Partition).filter(Partition.storage_section_id == storage_section_id)
     query = order_by_numeric_suffix(query, Partition.id)
-    return query.all()
+    return query.yield_per(500)
 
 def get_partition_count(db: Session) -> int:
     """Get total partition count"""
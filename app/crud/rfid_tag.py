@@ -1,16 +1,20 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import inspect
+from sqlalchemy import Row, inspect, select, update, exists, func, literal, lambda_stmt, cast, null, String, Integer, Float
 from app.schemas.rfid_tag import RFIDTagUpdate, RFIDTagResponse
 from app.models.rfid_tag import RFIDTag
 from app.models.large_item import LargeItem
 from app.models.partition import Partition
 from app.models.container import Container
-from app.models.item import Item
-from typing import List, Optional, Tuple, Dict, Any
-from app.crud.general import order_by_numeric_suffix
+from app.models.item import Item, PartitionStat, ContainerStat
+from typing import Iterator, List, Optional, Tuple, Dict, Any
+from app.crud.general import order_by_numeric_suffix, filter_after_numeric_suffix, paginate_with_total
+
+def _get_tag(db: Session, tag_id: str) -> Optional[RFIDTag]:
+    """Point lookup by id; lambda_stmt caches the compiled SELECT so only tag_id is bound per call"""
+    return db.execute(lambda_stmt(lambda: select(RFIDTag).where(RFIDTag.id == tag_id))).scalar_one_or_none()
 
 def get_rfid_tag(db: Session, tag_id: str) -> Optional[RFIDTagResponse]:
-    tag = db.query(RFIDTag).filter(RFIDTag.id == tag_id).first()
+    tag = _get_tag(db, tag_id)
     if tag:
         return RFIDTagResponse.model_validate(tag)
     return None
@@ -20,9 +24,14 @@ def get_rfid_tags(
     page: int = 1, 
     page_size: int = 10,
     search: Optional[str] = None,
-    assigned_filter: Optional[bool] = None
-) -> Tuple[List[Dict[str, Any]], int]:
-    """Get RFID tags with pagination and search. Returns enriched dicts including assignment info."""
+    assigned_filter: Optional[bool] = None,
+    after: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[str]]:
+    """
+    Get RFID tags with pagination and search. Returns enriched dicts including assignment info.
+    Pass `after` (a tag id) for keyset pagination; the total count is skipped in that mode.
+    Returns (tags, total_count, next_cursor).
+    """
     query = db.query(RFIDTag)
     
     if search:
@@ -32,52 +41,79 @@ def get_rfid_tags(
     if assigned_filter is not None:
         query = query.filter(RFIDTag.assigned == assigned_filter)
     
-    total_count = query.count()
-    
-    skip = (page - 1) * page_size
     query = order_by_numeric_suffix(query, RFIDTag.id)
-    tags = query.offset(skip).limit(page_size).all()
+
+    if after:
+        query = filter_after_numeric_suffix(query, RFIDTag.id, after)
+        tags = query.limit(page_size).all()
+        total_count = None
+    else:
+        tags, total_count = paginate_with_total(query, page, page_size)
+    next_cursor = tags[-1].id if len(tags) == page_size else None
+
+    # Lookup unit and item information for all assigned tags on this page in one query
+    assigned_ids = [t.id for t in tags if t.assigned]
+    units_by_tag: Dict[str, Any] = {}
+    if assigned_ids:
+        units = _units_by_rfid_tag_subquery()
+        unit_rows = db.execute(
+            select(units.c.rfid_tag_id, units.c.id, units.c.item_id, units.c.unit_type, Item.name)
+            .outerjoin(Item, Item.id == units.c.item_id)
+            .where(units.c.rfid_tag_id.in_(assigned_ids))
+        ).all()
+        for u in unit_rows:
+            units_by_tag.setdefault(u.rfid_tag_id, u)
 
     results: List[Dict[str, Any]] = []
     for t in tags:
-        row: Dict[str, Any] = {
+        # unassigned tags, or assigned flag true but no unit found (possible data inconsistency)
+        unit = units_by_tag.get(t.id)
+        results.append({
             "id": t.id,
             "assigned": bool(t.assigned),
-        }
-        # Lookup unit and item information if assigned
-        if t.assigned:
-            unit = get_unit_by_rfid_tag(db, t.id)
-            if unit:
-                # unit dict from get_unit_by_rfid_tag includes 'id', 'item_id', 'item_name' and 'item_type'
-                row["unit_id"] = unit.get("id")
-                row["item_type"] = unit.get("unit_type")
-                row["item_id"] = unit.get("item_id")
-                row["item_name"] = unit.get("item_name")
-            else:
-                # assigned flag true but not found (possible data inconsistency)
-                row["unit_id"] = None
-                row["item_type"] = None
-                row["item_id"] = None
-                row["item_name"] = None
-        else:
-            row["unit_id"] = None
-            row["item_type"] = None
-            row["item_id"] = None
-            row["item_name"] = None
-
-        results.append(row)
+            "unit_id": unit.id if unit else None,
+            "item_type": unit.unit_type if unit else None,
+            "item_id": unit.item_id if unit else None,
+            "item_name": unit.name if unit else None,
+        })
     
-    return results, total_count
+    return results, total_count, next_cursor
+
+def _unit_select(model, unit_type: str):
+    """SELECT of one unit table shaped to the common UNION ALL column list"""
+    return select(
+        model.id,
+        model.item_id,
+        model.storage_section_id,
+        model.rfid_tag_id,
+        # each unit table has its own enum type; text keeps the UNION compatible
+        cast(model.status, String).label("status"),
+        (model.quantity if hasattr(model, "quantity") else null().cast(Integer)).label("quantity"),
+        (model.items_weight if hasattr(model, "items_weight") else null().cast(Float)).label("items_weight"),
+        literal(unit_type).label("unit_type"),
+    )
+
+def _units_by_rfid_tag_subquery():
+    """UNION ALL of large_items / partitions / containers keyed by rfid_tag_id"""
+    return (
+        _unit_select(LargeItem, "large_item")
+        .union_all(
+            _unit_select(Partition, "partition"),
+            _unit_select(Container, "container"),
+        )
+        .subquery("units")
+    )
 
 def create_rfid_tag(db: Session) -> RFIDTagResponse:
     db_tag = RFIDTag(assigned=False)
     db.add(db_tag)
-    db.commit()
-    db.refresh(db_tag)
+    # the id comes back from INSERT ... RETURNING (eager_defaults), so there is nothing to reload;
+    # the route's get_db_tx commits
+    db.flush()
     return RFIDTagResponse.model_validate(db_tag)
 
 def update_rfid_tag(db: Session, tag_id: str, tag: RFIDTagUpdate) -> Optional[RFIDTagResponse]:
-    db_tag = db.query(RFIDTag).filter(RFIDTag.id == tag_id).first()
+    db_tag = _get_tag(db, tag_id)
     if db_tag:
         db_tag.assigned = tag.assigned
         db.commit()
@@ -86,7 +122,7 @@ def update_rfid_tag(db: Session, tag_id: str, tag: RFIDTagUpdate) -> Optional[RF
     return None
 
 def delete_rfid_tag(db: Session, tag_id: str) -> Optional[RFIDTagResponse]:
-    db_tag = db.query(RFIDTag).filter(RFIDTag.id == tag_id).first()
+    db_tag = _get_tag(db, tag_id)
     if db_tag:
         if db_tag.assigned:
             raise ValueError({"field": "tag_id", "message": f"Cannot delete assigned RFID tag {tag_id}. Unassign it first."})
@@ -97,46 +133,80 @@ def delete_rfid_tag(db: Session, tag_id: str) -> Optional[RFIDTagResponse]:
         return result
     return None
 
-def get_unassigned_rfid_tags(db: Session) -> List[RFIDTag]:
-    return db.query(RFIDTag).filter(RFIDTag.assigned == False).order_by(RFIDTag.id).all()
+# list endpoints only read id/assigned, so return plain rows instead of identity-mapped RFIDTag instances
+# unbounded listings are streamed in batches from a server-side cursor
+def get_unassigned_rfid_tags(db: Session, skip: int = 0, limit: Optional[int] = None) -> Iterator[Row]:
+    return db.execute(
+        select(RFIDTag.id, RFIDTag.assigned).where(RFIDTag.assigned == False).order_by(RFIDTag.id)
+        .offset(skip).limit(limit)
+        .execution_options(yield_per=500)
+    )
 
-def get_assigned_rfid_tags(db: Session) -> List[RFIDTag]:
-    return db.query(RFIDTag).filter(RFIDTag.assigned == True).order_by(RFIDTag.id).all()
+def get_assigned_rfid_tags(db: Session, skip: int = 0, limit: Optional[int] = None) -> Iterator[Row]:
+    return db.execute(
+        select(RFIDTag.id, RFIDTag.assigned).where(RFIDTag.assigned == True).order_by(RFIDTag.id)
+        .offset(skip).limit(limit)
+        .execution_options(yield_per=500)
+    )
 
-def search_rfid_tags_by_keyword(db: Session, keyword: str, limit: int = 20) -> List[RFIDTag]:
+def search_rfid_tags_by_keyword(db: Session, keyword: str, limit: int = 20) -> List[Row]:
     """Quick search for autocomplete/dropdown"""
     search_term = f"%{keyword}%"
-    return db.query(RFIDTag).filter(
-        RFIDTag.id.ilike(search_term)
-    ).order_by(RFIDTag.id).limit(limit).all()
+    return db.execute(
+        select(RFIDTag.id, RFIDTag.assigned).where(RFIDTag.id.ilike(search_term)).order_by(RFIDTag.id).limit(limit)
+    ).all()
 
-def get_available_rfid_tags_for_assignment(db: Session, limit: int = 50) -> List[RFIDTag]:
+def get_available_rfid_tags_for_assignment(db: Session, limit: int = 50) -> List[Row]:
     """Get unassigned RFID tags available for assignment"""
-    return db.query(RFIDTag).filter(
-        RFIDTag.assigned == False
-    ).order_by(RFIDTag.id).limit(limit).all()
+    return db.execute(
+        select(RFIDTag.id, RFIDTag.assigned).where(RFIDTag.assigned == False).order_by(RFIDTag.id).limit(limit)
+    ).all()
 
 def check_rfid_availability(db: Session, tag_id: str) -> bool:
-    tag = db.query(RFIDTag).filter(RFIDTag.id == tag_id).first()
-    return tag is not None and not tag.assigned
+    # boolean EXISTS instead of materializing the tag row
+    return bool(db.execute(
+        lambda_stmt(lambda: select(exists().where(RFIDTag.id == tag_id, RFIDTag.assigned == False)))
+    ).scalar())
+
+def _set_assigned(db: Session, tag_id: str, assigned: bool) -> Optional[RFIDTagResponse]:
+    """Compare-and-set `assigned` in one UPDATE ... RETURNING; None if missing or already in that state"""
+    row = db.execute(
+        update(RFIDTag)
+        .where(RFIDTag.id == tag_id, RFIDTag.assigned == (not assigned))
+        .values(assigned=assigned)
+        .returning(RFIDTag)
+    ).scalar_one_or_none()
+    result = RFIDTagResponse.model_validate(row) if row else None
+    db.commit()
+    return result
 
 def assign_rfid_tag(db: Session, tag_id: str) -> Optional[RFIDTagResponse]:
-    db_tag = db.query(RFIDTag).filter(RFIDTag.id == tag_id).first()
-    if db_tag and not db_tag.assigned:
-        db_tag.assigned = True
-        db.commit()
-        db.refresh(db_tag)
-        return RFIDTagResponse.model_validate(db_tag)
-    return None
+    return _set_assigned(db, tag_id, True)
 
 def unassign_rfid_tag(db: Session, tag_id: str) -> Optional[RFIDTagResponse]:
-    db_tag = db.query(RFIDTag).filter(RFIDTag.id == tag_id).first()
-    if db_tag and db_tag.assigned:
-        db_tag.assigned = False
-        db.commit()
-        db.refresh(db_tag)
-        return RFIDTagResponse.model_validate(db_tag)
-    return None
+    return _set_assigned(db, tag_id, False)
+
+def _set_assigned_bulk(db: Session, tag_ids: List[str], assigned: bool) -> List[RFIDTagResponse]:
+    """Flip `assigned` on every listed tag currently in the opposite state with one UPDATE ... RETURNING"""
+    stmt = (
+        update(RFIDTag)
+        .where(RFIDTag.id.in_(tag_ids), RFIDTag.assigned == (not assigned))
+        .values(assigned=assigned)
+        .returning(RFIDTag)
+        .execution_options(synchronize_session=False)
+    )
+    # build responses before commit expires the returned rows
+    updated = [RFIDTagResponse.model_validate(t) for t in db.execute(stmt).scalars().all()]
+    db.commit()
+    return updated
+
+def assign_rfid_tags_bulk(db: Session, tag_ids: List[str]) -> List[RFIDTagResponse]:
+    """Assign many tags at once; tags that are missing or already assigned are skipped"""
+    return _set_assigned_bulk(db, tag_ids, True)
+
+def unassign_rfid_tags_bulk(db: Session, tag_ids: List[str]) -> List[RFIDTagResponse]:
+    """Unassign many tags at once; tags that are missing or already unassigned are skipped"""
+    return _set_assigned_bulk(db, tag_ids, False)
 
 def get_rfid_tag_count(db: Session) -> int:
     """Get total RFID tag count"""
@@ -150,45 +220,55 @@ def get_unassigned_tag_count(db: Session) -> int:
     """Get count of unassigned tags"""
     return db.query(RFIDTag).filter(RFIDTag.assigned == False).count()
 
-def _model_to_dict(instance):
-    mapper = inspect(instance.__class__)
-    return {c.key: getattr(instance, c.key) for c in mapper.column_attrs}
-
-def get_unit_by_rfid_tag(db: Session, rfidtag: str):
-    """Return first matching record from large_items / partitions / containers for the given rfidtag
-    as a plain dict including the linked item name (item_name), or None.
-    Uses SQLAlchemy ORM instead of raw SQL.
-    """
-    # import models here to avoid circular import at module import time
+def get_rfid_tag_counts(db: Session) -> Tuple[int, int, int]:
+    """Get (total, assigned, unassigned) tag counts in one scan using filtered aggregates"""
+    total, assigned, unassigned = db.execute(
+        select(
+            func.count(),
+            func.count().filter(RFIDTag.assigned == True),
+            func.count().filter(RFIDTag.assigned == False),
+        ).select_from(RFIDTag)
+    ).one()
+    return total, assigned, unassigned
 
+_UNIT_MODELS = {"large_item": LargeItem, "partition": Partition, "container": Container}
 
-    # check large items
-    unit = db.query(LargeItem).filter(LargeItem.rfid_tag_id == rfidtag).first()
-    if unit:
-        result = _model_to_dict(unit)
-        item = db.query(Item).filter(Item.id == getattr(unit, "item_id", None)).first()
-        result["item_name"] = item.name if item else None
-        result["unit_type"] = "large_item"
-        return result
+# column keys per mapped class, resolved once instead of inspecting the mapper on every call
+_COLUMN_KEYS: Dict[type, Tuple[str, ...]] = {}
 
-    # check partitions
-    unit = db.query(Partition).filter(Partition.rfid_tag_id == rfidtag).first()
-    if unit:
-        result = _model_to_dict(unit)
-        item = db.query(Item).filter(Item.id == getattr(unit, "item_id", None)).first()
-        result["item_name"] = item.name if item else None
-        result["unit_type"] = "partition"
-        result["partition_capacity"] = item.partition_stat.partition_capacity
-        return result
+def _column_keys(model) -> Tuple[str, ...]:
+    keys = _COLUMN_KEYS.get(model)
+    if keys is None:
+        keys = tuple(c.key for c in inspect(model).column_attrs)
+        _COLUMN_KEYS[model] = keys
+    return keys
 
-    # check containers
-    unit = db.query(Container).filter(Container.rfid_tag_id == rfidtag).first()
-    if unit:
-        result = _model_to_dict(unit)
-        item = db.query(Item).filter(Item.id == getattr(unit, "item_id", None)).first()
-        result["item_name"] = item.name if item else None
-        result["unit_type"] = "container"
-        result["container_weight"] = item.container_stat.container_weight
-        return result
+def get_unit_by_rfid_tag(db: Session, rfidtag: str):
+    """Return the matching record from large_items / partitions / containers for the given rfidtag
+    as a plain dict including the linked item name (item_name), or None.
+    Resolves unit, item and stats in a single UNION ALL query.
+    """
+    units = _units_by_rfid_tag_subquery()
+    row = db.execute(
+        select(units, Item.name.label("item_name"), PartitionStat.partition_capacity, ContainerStat.container_weight)
+        .outerjoin(Item, Item.id == units.c.item_id)
+        .outerjoin(PartitionStat, PartitionStat.item_id == units.c.item_id)
+        .outerjoin(ContainerStat, ContainerStat.item_id == units.c.item_id)
+        .where(units.c.rfid_tag_id == rfidtag)
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
 
-    return None
\ No newline at end of file
+    model = _UNIT_MODELS[row.unit_type]
+    mapping = row._mapping
+    result = {k: mapping[k] for k in _column_keys(model)}
+    # status came back as the enum name; restore the model's enum member
+    result["status"] = model.status.type.enum_class[row.status]
+    result["item_name"] = row.item_name
+    result["unit_type"] = row.unit_type
+    if row.unit_type == "partition":
+        result["partition_capacity"] = row.partition_capacity
+    elif row.unit_type == "container":
+        result["container_weight"] = row.container_weight
+    return result
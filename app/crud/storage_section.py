@@ -1,30 +1,37 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, case, Integer
+from sqlalchemy import exists, or_
+from sqlalchemy.orm import Session, with_expression
 from app.models.storage_section import StorageSection, SectionColor
+from app.models.partition import Partition
+from app.models.large_item import LargeItem
+from app.models.container import Container
 from app.schemas.storage_section import StorageSectionCreate, StorageSectionUpdate
 from typing import List, Optional, Tuple
+from app.crud.general import paginate_with_total
 
 def natural_sort_key_db(query):
-    """Add natural sorting to SQLAlchemy query"""
-    return query.order_by(
-        # Sort by floor number (F1, F2, F10...)
-        func.cast(func.substring(StorageSection.floor, 2), Integer),
-        # Sort by cabinet number (C1, C2, C10...)
-        func.cast(func.substring(StorageSection.cabinet, 2), Integer),
-        # Sort by layer number (L1, L2, L10...)
-        func.cast(func.substring(StorageSection.layer, 2), Integer),
-        # Sort by color (RED, GREEN, BLUE, YELLOW)
-        case(
-            (StorageSection.color == SectionColor.RED, 1),
-            (StorageSection.color == SectionColor.GREEN, 2),
-            (StorageSection.color == SectionColor.BLUE, 3),
-            (StorageSection.color == SectionColor.YELLOW, 4),
-            else_=5
-        )
+    """Add natural sorting (floor, cabinet, layer numbers, then color) to SQLAlchemy query"""
+    # sort_key is precomputed on write (StorageSection.generate_sort_key) and indexed
+    return query.order_by(StorageSection.sort_key, StorageSection.id)
+
+def _in_use_condition(section_id):
+    """True when any partition, large item or container sits in the section (index probes, no rows loaded)"""
+    return or_(
+        exists().where(Partition.storage_section_id == section_id),
+        exists().where(LargeItem.storage_section_id == section_id),
+        exists().where(Container.storage_section_id == section_id),
     )
 
+def with_in_use(query):
+    """Fill StorageSection.in_use in the same SELECT instead of loading the child collections"""
+    return query.options(with_expression(StorageSection.in_use, _in_use_condition(StorageSection.id)))
+
+def is_storage_section_in_use(db: Session, section_id: str) -> bool:
+    return db.query(_in_use_condition(section_id)).scalar()
+
 def get_storage_section(db: Session, section_id: str) -> Optional[StorageSection]:
-    return db.query(StorageSection).filter(StorageSection.id == section_id).first()
+    # Session.get checks the request session's identity map first, so repeat lookups of the
+    # same section within one request don't hit the database; commits expire it automatically
+    return db.get(StorageSection, section_id)
 
 def get_storage_sections(
     db: Session, 
@@ -34,20 +41,16 @@ def get_storage_sections(
     floor: Optional[str] = None,
     cabinet: Optional[str] = None,
     color: Optional[SectionColor] = None,
+    load_in_use: bool = False,
 ) -> Tuple[List[StorageSection], int]:
     """Get storage sections with pagination, search, and smart sorting"""
     query = db.query(StorageSection)
     
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                StorageSection.id.ilike(search_term),
-                StorageSection.floor.ilike(search_term),
-                StorageSection.cabinet.ilike(search_term),
-                StorageSection.layer.ilike(search_term)
-            )
-        )
+        # id is "<floor>-<cabinet>-<layer>-<color>", so matching it covers all components
+        # in one predicate served by the ix_storage_sections_id_trgm trigram index
+        query = query.filter(StorageSection.id.ilike(search_term))
     
     if floor:
         query = query.filter(StorageSection.floor == floor.upper())
@@ -58,12 +61,9 @@ def get_storage_sections(
     
     
     query = natural_sort_key_db(query)
-    total_count = query.count()
-    
-    skip = (page - 1) * page_size
-    sections = query.offset(skip).limit(page_size).all()
-    
-    return sections, total_count
+    if load_in_use:
+        query = with_in_use(query)
+    return paginate_with_total(query, page, page_size)
 
 def create_storage_section(db: Session, section: StorageSectionCreate) -> StorageSection:
     section_id = StorageSection.generate_id(
@@ -72,15 +72,17 @@ def create_storage_section(db: Session, section: StorageSectionCreate) -> Storag
     
     db_section = StorageSection(
         id=section_id,
+        sort_key=StorageSection.generate_sort_key(section.floor, section.cabinet, section.layer, section.color),
         **section.model_dump()
     )
     db.add(db_section)
-    db.commit()
+    # flush only; the route's get_db_tx commits once for the whole request
+    db.flush()
     db.refresh(db_section)
     return db_section
 
 def update_storage_section(db: Session, section_id: str, section: StorageSectionUpdate) -> Optional[StorageSection]:
-    db_section = db.query(StorageSection).filter(StorageSection.id == section_id).first()
+    db_section = get_storage_section(db, section_id)
     if not db_section:
         return None
     update_data = section.model_dump(exclude_unset=True)
@@ -91,38 +93,39 @@ def update_storage_section(db: Session, section_id: str, section: StorageSection
         new_color = update_data.get('color', db_section.color)
         new_id = StorageSection.generate_id(new_floor, new_cabinet, new_layer, new_color.value)
         update_data['id'] = new_id
+        update_data['sort_key'] = StorageSection.generate_sort_key(new_floor, new_cabinet, new_layer, new_color)
     for key, value in update_data.items():
         setattr(db_section, key, value)
-    db.commit()
+    db.flush()
     db.refresh(db_section)
     return db_section
 
 def delete_storage_section(db: Session, section_id: str) -> Optional[StorageSection]:
-    db_section = db.query(StorageSection).filter(StorageSection.id == section_id).first()
+    db_section = get_storage_section(db, section_id)
     if not db_section:
         return None
     db.delete(db_section)
-    db.commit()
+    db.flush()
     return db_section
 
-def search_storage_sections_by_keyword(db: Session, keyword: str, limit: int = 20) -> List[StorageSection]:
+def search_storage_sections_by_keyword(db: Session, keyword: str, limit: int = 20, load_in_use: bool = False) -> List[StorageSection]:
     search_term = f"%{keyword}%"
-    query = db.query(StorageSection).filter(
-        or_(
-            StorageSection.id.ilike(search_term),
-            StorageSection.floor.ilike(search_term),
-            StorageSection.cabinet.ilike(search_term),
-            StorageSection.layer.ilike(search_term)
-        )
-    )
+    # id embeds floor/cabinet/layer, see get_storage_sections
+    query = db.query(StorageSection).filter(StorageSection.id.ilike(search_term))
+    if load_in_use:
+        query = with_in_use(query)
     return natural_sort_key_db(query).limit(limit).all()
 
-def get_sections_by_floor(db: Session, floor: str) -> List[StorageSection]:
+def get_sections_by_floor(db: Session, floor: str, load_in_use: bool = False) -> List[StorageSection]:
     query = db.query(StorageSection).filter(StorageSection.floor == floor.upper())
+    if load_in_use:
+        query = with_in_use(query)
     return natural_sort_key_db(query).all()
 
-def get_sections_by_color(db: Session, color: SectionColor) -> List[StorageSection]:
+def get_sections_by_color(db: Session, color: SectionColor, load_in_use: bool = False) -> List[StorageSection]:
     query = db.query(StorageSection).filter(StorageSection.color == color)
+    if load_in_use:
+        query = with_in_use(query)
     return natural_sort_key_db(query).all()
 
 
@@ -1,10 +1,32 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, and_, func, or_
-from typing import List, Optional, Dict, Any
+from sqlalchemy import event, RowMapping, desc, asc, and_, func, distinct, false, literal, select, lambda_stmt
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime, timezone, timedelta
 from app.models.transaction import Transaction, TransactionType, ItemType
-from app.schemas.transaction import TransactionCreate, TransactionFilter
-from app.crud.general import order_by_numeric_suffix
+from app.schemas.transaction import TransactionCreate, TransactionFilter, TransactionResponse
+from app.crud.general import bulk_create, order_by_numeric_suffix, offset_with_total
+from app.utils.cache import TTLCache
+
+# dashboard counters and the recent feed are read far more often than transactions are written.
+# The cache is per process: a worker drops it once its own transaction writes commit, while other
+# workers keep serving their snapshot until the TTL runs out, so totals are eventually consistent
+# (at most 30s behind)
+_stats_cache = TTLCache(ttl=30)
+_STATS_STALE = "transaction_stats_stale"
+
+def _mark_stats_stale(db: Session) -> None:
+    """Drop the cached counters when this session's transaction commits"""
+    db.info[_STATS_STALE] = True
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stats_after_commit(session):
+    # after the commit, so a concurrent reader can't re-cache the pre-commit totals
+    if session.info.pop(_STATS_STALE, False):
+        _stats_cache.invalidate()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_stats(session):
+    session.info.pop(_STATS_STALE, None)
 
 def create_transaction(db: Session, transaction: TransactionCreate) -> Transaction:
     """Create a new transaction"""
@@ -27,167 +49,203 @@ def create_transaction(db: Session, transaction: TransactionCreate) -> Transacti
     )
     
     db.add(db_transaction)
-    db.commit()
+    _mark_stats_stale(db)
+    # flush only; the route's get_db_tx commits once for the whole request
+    db.flush()
     db.refresh(db_transaction)
     return db_transaction
 
+def create_transactions_bulk(db: Session, transactions: List[TransactionCreate]) -> List[Transaction]:
+    """Create many transactions with one multi-row INSERT ... RETURNING"""
+    if not transactions:
+        return []
+
+    created = bulk_create(db, Transaction, [t.model_dump() for t in transactions])
+    _mark_stats_stale(db)
+    return created
+
 def get_transaction(db: Session, transaction_id: str) -> Optional[Transaction]:
-    return db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    # lambda_stmt caches the compiled SELECT; only transaction_id is bound per call
+    return db.execute(lambda_stmt(lambda: select(Transaction).where(Transaction.id == transaction_id))).scalar_one_or_none()
+
+# whitelisted sort columns; fixed column objects keep the compiled ORDER BY cacheable
+_SORT_COLUMNS = {
+    "transaction_date": Transaction.transaction_date,
+    "transaction_type": Transaction.transaction_type,
+    "item_type": Transaction.item_type,
+    "item_id": Transaction.item_id,
+    "item_name": Transaction.item_name,
+    "partition_id": Transaction.partition_id,
+    "large_item_id": Transaction.large_item_id,
+    "container_id": Transaction.container_id,
+    "storage_section_id": Transaction.storage_section_id,
+    "user_name": Transaction.user_name,
+    "previous_quantity": Transaction.previous_quantity,
+    "current_quantity": Transaction.current_quantity,
+    "quantity_change": Transaction.quantity_change,
+    "previous_weight": Transaction.previous_weight,
+    "current_weight": Transaction.current_weight,
+    "weight_change": Transaction.weight_change,
+}
+
+def _order_transactions(query, sort_by: str, sort_order: str):
+    """Apply ORDER BY for a whitelisted sort column"""
+    if sort_by == "id":
+        return order_by_numeric_suffix(query, Transaction.id, asc=(sort_order.lower() != "desc"))
+    column = _SORT_COLUMNS.get(sort_by)
+    if column is None:
+        raise ValueError({"field": "sort_by", "message": f"Cannot sort by '{sort_by}'"})
+    return query.order_by(desc(column) if sort_order.lower() == "desc" else asc(column))
 
 def get_transactions(db: Session, skip: int = 0, limit: int = 100, sort_by: str = "transaction_date", sort_order: str = "desc") -> List[Transaction]:
     query = db.query(Transaction)
-    if sort_by == "id":
-        query = order_by_numeric_suffix(query, Transaction.id, asc=(sort_order.lower() != "desc"))
-    else:
-        attr = getattr(Transaction, sort_by, Transaction.transaction_date)
-        query = query.order_by(desc(attr) if sort_order.lower() == "desc" else asc(attr))
+    query = _order_transactions(query, sort_by, sort_order)
     return query.offset(skip).limit(limit).all()
 
-def get_transactions_filtered(db: Session, filters: TransactionFilter, skip: int = 0, limit: int = 100, sort_by: str = "transaction_date", sort_order: str = "desc") -> tuple[List[Transaction], int]:
-    query = db.query(Transaction)
-    conditions = []
-    
-    if filters.transaction_types:
-        conditions.append(Transaction.transaction_type.in_(filters.transaction_types))
-    if filters.item_types:
-        conditions.append(Transaction.item_type.in_(filters.item_types))
-    if filters.item_ids:
-        conditions.append(Transaction.item_id.in_(filters.item_ids))
-    if filters.storage_section_ids:
-        conditions.append(Transaction.storage_section_id.in_(filters.storage_section_ids))
-    if filters.users:
-        conditions.append(Transaction.user_name.in_(filters.users))
-    if filters.start_date:
-        conditions.append(Transaction.transaction_date >= filters.start_date)
-    if filters.end_date:
-        conditions.append(Transaction.transaction_date <= filters.end_date)
-    # keyword search across multiple fields
-    if getattr(filters, "search", None):
-        term = f"%{filters.search}%"
-        conditions.append(or_(
-            Transaction.item_id.ilike(term),
-            Transaction.item_name.ilike(term),
-            Transaction.partition_id.ilike(term),
-            Transaction.large_item_id.ilike(term),
-            Transaction.container_id.ilike(term),
-            Transaction.user_name.ilike(term)
-        ))
-    
+def _search_condition(keyword: str):
+    # keyword search across item id/name, unit ids and user name via the trigram-indexed search_blob;
+    # the blob's chr(31) field separator can't be part of a match, just as with one ILIKE per field
+    if "\x1f" in keyword:
+        return false()
+    return Transaction.search_blob.like(f"%{keyword.lower()}%")
+
+# TransactionFilter field -> predicate builder; only fields with a truthy value are applied
+_FILTER_MAP = (
+    ("transaction_types", Transaction.transaction_type.in_),
+    ("item_types", Transaction.item_type.in_),
+    ("item_ids", Transaction.item_id.in_),
+    ("storage_section_ids", Transaction.storage_section_id.in_),
+    ("users", Transaction.user_name.in_),
+    ("start_date", Transaction.transaction_date.__ge__),
+    ("end_date", Transaction.transaction_date.__le__),
+    ("search", _search_condition),
+)
+
+def _apply_filters(query, filters: Optional[TransactionFilter]):
+    """Apply the set TransactionFilter fields to a Query or select()"""
+    conditions = [build(value) for field, build in _FILTER_MAP if (value := getattr(filters, field, None))]
+    # no filters set: leave the query bare instead of wrapping an empty and_()
     if conditions:
         query = query.filter(and_(*conditions))
+    return query
+
+def get_transactions_filtered(db: Session, filters: TransactionFilter, skip: int = 0, limit: int = 100, sort_by: str = "transaction_date", sort_order: str = "desc") -> tuple[List[Transaction], int]:
+    query = _apply_filters(db.query(Transaction), filters)
     
-    total_count = query.count()
-    if sort_by == "id":
-        query = order_by_numeric_suffix(query, Transaction.id, asc=(sort_order.lower() != "desc"))
-    else:
-        attr = getattr(Transaction, sort_by, Transaction.transaction_date)
-        query = query.order_by(desc(attr) if sort_order.lower() == "desc" else asc(attr))
-    transactions = query.offset(skip).limit(limit).all()
-    
-    return transactions, total_count
+    query = _order_transactions(query, sort_by, sort_order)
+    return offset_with_total(query, skip, limit)
+
+def get_recent_transactions(db: Session, days: int = 7, limit: int = 50) -> List[TransactionResponse]:
+    # polled by dashboard widgets; cache the serialized rows so no ORM state outlives the session
+    return _stats_cache.get_or_set(("recent", days, limit), lambda: [
+        TransactionResponse.model_validate(txn, from_attributes=True) for txn in _query_recent_transactions(db, days, limit)
+    ])
 
-def get_recent_transactions(db: Session, days: int = 7, limit: int = 50) -> List[Transaction]:
+def _query_recent_transactions(db: Session, days: int, limit: int) -> List[Transaction]:
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-    return db.query(Transaction)\
-        .filter(Transaction.transaction_date >= cutoff_date)\
-        .order_by(desc(Transaction.transaction_date))\
-        .limit(limit)\
-        .all()
+    # fixed shape: lambda_stmt skips rebuilding the statement; cutoff_date and limit are bound per call
+    return db.execute(lambda_stmt(
+        lambda: select(Transaction)
+        .where(Transaction.transaction_date >= cutoff_date)
+        .order_by(desc(Transaction.transaction_date))
+        .limit(limit)
+    )).scalars().all()
 
-def get_transactions_by_item(db: Session, item_id: str, skip: int = 0, limit: int = 10):
-    query = db.query(Transaction).filter(Transaction.item_id == item_id)
-    total_count = query.count()
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
-    return transactions, total_count
+# reference column per history lookup; each is backed by a (column, transaction_date DESC) index
+_HISTORY_COLUMNS = {
+    "item": Transaction.item_id,
+    "partition": Transaction.partition_id,
+    "container": Transaction.container_id,
+    "large_item": Transaction.large_item_id,
+    "storage_section": Transaction.storage_section_id,
+    "user": Transaction.user_name,
+}
 
+def get_transactions_by(db: Session, kind: str, value: str, skip: int = 0, limit: int = 10):
+    """Newest-first transactions for one reference column, with the total count"""
+    column = _HISTORY_COLUMNS[kind]
+    query = db.query(Transaction).filter(column == value)
+    return offset_with_total(query.order_by(Transaction.transaction_date.desc()), skip, limit)
 
-def get_transactions_by_partition(db: Session, partition_id: str, skip: int = 0, limit: int = 10):
-    query = db.query(Transaction).filter(Transaction.partition_id == partition_id)
-    total_count = query.count()
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
-    return transactions, total_count
+def get_transactions_by_item(db: Session, item_id: str, skip: int = 0, limit: int = 10):
+    return get_transactions_by(db, "item", item_id, skip, limit)
 
+def get_transactions_by_partition(db: Session, partition_id: str, skip: int = 0, limit: int = 10):
+    return get_transactions_by(db, "partition", partition_id, skip, limit)
 
 def get_transactions_by_container(db: Session, container_id: str, skip: int = 0, limit: int = 10):
-    query = db.query(Transaction).filter(Transaction.container_id == container_id)
-    total_count = query.count()
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
-    return transactions, total_count
-
+    return get_transactions_by(db, "container", container_id, skip, limit)
 
 def get_transactions_by_large_item(db: Session, large_item_id: str, skip: int = 0, limit: int = 10):
-    query = db.query(Transaction).filter(Transaction.large_item_id == large_item_id)
-    total_count = query.count()
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
-    return transactions, total_count
-
+    return get_transactions_by(db, "large_item", large_item_id, skip, limit)
 
 def get_transactions_by_storage_section(db: Session, storage_section_id: str, skip: int = 0, limit: int = 10):
-    query = db.query(Transaction).filter(Transaction.storage_section_id == storage_section_id)
-    total_count = query.count()
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
-    return transactions, total_count
-
+    return get_transactions_by(db, "storage_section", storage_section_id, skip, limit)
 
 def get_transactions_by_user(db: Session, user_name: str, skip: int = 0, limit: int = 10):
-    query = db.query(Transaction).filter(Transaction.user_name == user_name)
-    total_count = query.count()
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
-    return transactions, total_count
+    return get_transactions_by(db, "user", user_name, skip, limit)
 
 def get_transaction_count(db: Session) -> int:
     """Return total number of transactions"""
-    return db.query(Transaction).count()
+    return _stats_cache.get_or_set("count", lambda: db.query(Transaction).count())
 
 def get_transaction_stats(db: Session, filters: Optional[TransactionFilter] = None) -> Dict[str, Any]:
-    query = db.query(Transaction)
+    key = ("stats", filters.model_dump_json() if filters else None)
+    return _stats_cache.get_or_set(key, lambda: _compute_transaction_stats(db, filters))
+
+def _compute_transaction_stats(db: Session, filters: Optional[TransactionFilter] = None) -> Dict[str, Any]:
+    # Everything is computed in one scan: date filters restrict the scanned rows, while the
+    # type filters are applied per aggregate (FILTER) because the quantity/weight totals
+    # always cover partition/container returns regardless of the requested types.
+    date_conditions = []
+    type_conditions = []
     if filters:
-        conditions = []
         if filters.transaction_types:
-            conditions.append(Transaction.transaction_type.in_(filters.transaction_types))
+            type_conditions.append(Transaction.transaction_type.in_(filters.transaction_types))
         if filters.item_types:
-            conditions.append(Transaction.item_type.in_(filters.item_types))
+            type_conditions.append(Transaction.item_type.in_(filters.item_types))
         if filters.start_date:
-            conditions.append(Transaction.transaction_date >= filters.start_date)
+            date_conditions.append(Transaction.transaction_date >= filters.start_date)
         if filters.end_date:
-            conditions.append(Transaction.transaction_date <= filters.end_date)
-        if conditions:
-            query = query.filter(and_(*conditions))
-    
-    total_transactions = query.count()
-    withdrawals = query.filter(Transaction.transaction_type == TransactionType.WITHDRAW).count()
-    returns = query.filter(Transaction.transaction_type == TransactionType.RETURN).count()
-    consumed = query.filter(Transaction.transaction_type == TransactionType.CONSUMED).count()
-    registrations = query.filter(Transaction.transaction_type == TransactionType.REGISTER).count()
-    
-    unique_items = query.with_entities(Transaction.item_id).distinct().count()
-    unique_users = query.filter(Transaction.user_name.isnot(None)).with_entities(Transaction.user_name).distinct().count()
-    
-    # Quantity changes for partition returns only
-    total_quantity_changes = db.query(func.coalesce(func.sum(Transaction.quantity_change), 0))\
-        .filter(Transaction.item_type == ItemType.PARTITION, Transaction.transaction_type == TransactionType.RETURN)
-    # Weight changes for container returns only
-    total_weight_changes = db.query(func.coalesce(func.sum(Transaction.weight_change), 0.0))\
-        .filter(Transaction.item_type == ItemType.CONTAINER, Transaction.transaction_type == TransactionType.RETURN)
-    
-    if filters:
-        if filters.start_date:
-            total_quantity_changes = total_quantity_changes.filter(Transaction.transaction_date >= filters.start_date)
-            total_weight_changes = total_weight_changes.filter(Transaction.transaction_date >= filters.start_date)
-        if filters.end_date:
-            total_quantity_changes = total_quantity_changes.filter(Transaction.transaction_date <= filters.end_date)
-            total_weight_changes = total_weight_changes.filter(Transaction.transaction_date <= filters.end_date)
-    
-    total_quantity_changes = total_quantity_changes.scalar()
-    total_weight_changes = total_weight_changes.scalar()
-    
+            date_conditions.append(Transaction.transaction_date <= filters.end_date)
+
+    def _typed(agg, *extra):
+        conds = type_conditions + list(extra)
+        return agg.filter(and_(*conds)) if conds else agg
+
+    query = db.query(
+        _typed(func.count()),
+        _typed(func.count(), Transaction.transaction_type == TransactionType.WITHDRAW),
+        _typed(func.count(), Transaction.transaction_type == TransactionType.RETURN),
+        _typed(func.count(), Transaction.transaction_type == TransactionType.CONSUMED),
+        _typed(func.count(), Transaction.transaction_type == TransactionType.REGISTER),
+        _typed(func.count(distinct(Transaction.item_id))),
+        _typed(func.count(distinct(Transaction.user_name))),
+        # Quantity changes for partition returns only
+        func.coalesce(func.sum(Transaction.quantity_change).filter(
+            Transaction.item_type == ItemType.PARTITION, Transaction.transaction_type == TransactionType.RETURN
+        ), 0),
+        # Weight changes for container returns only
+        func.coalesce(func.sum(Transaction.weight_change).filter(
+            Transaction.item_type == ItemType.CONTAINER, Transaction.transaction_type == TransactionType.RETURN
+        ), 0.0),
+        _typed(func.min(Transaction.transaction_date)),
+        _typed(func.max(Transaction.transaction_date)),
+    )
+    if date_conditions:
+        query = query.filter(and_(*date_conditions))
+
+    (
+        total_transactions, withdrawals, returns, consumed, registrations,
+        unique_items, unique_users, total_quantity_changes, total_weight_changes,
+        earliest, latest,
+    ) = query.one()
+
     date_range = {}
     if total_transactions > 0:
-        earliest = query.order_by(Transaction.transaction_date).first()
-        latest = query.order_by(desc(Transaction.transaction_date)).first()
         date_range = {
-            "earliest": earliest.transaction_date if earliest else None,
-            "latest": latest.transaction_date if latest else None
+            "earliest": earliest,
+            "latest": latest
         }
     
     return {
@@ -204,59 +262,45 @@ def get_transaction_stats(db: Session, filters: Optional[TransactionFilter] = No
     }
 
 def delete_transaction(db: Session, transaction_id: str) -> bool:
-    transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
-    if transaction:
-        db.delete(transaction)
-        db.commit()
-        return True
-    return False
-
-def get_transactions_for_export(
-    db: Session,
+    # single DELETE; the row itself is not needed by the caller
+    deleted = db.query(Transaction).filter(Transaction.id == transaction_id).delete(synchronize_session=False)
+    if deleted:
+        _mark_stats_stale(db)
+    return deleted > 0
+
+def transactions_export_select(
     filters: Optional[TransactionFilter] = None,
     sort_by: str = "transaction_date",
     sort_order: str = "desc",
-    limit: int = 10_000_000,
-) -> List[Dict[str, Any]]:
+):
     """
-    Return a list of plain dicts ready for CSV export using the same filtering logic
-    as get_transactions / get_transactions_filtered.
+    Core SELECT of the CSV export columns, with the same filtering and sorting as
+    get_transactions_filtered. Raises ValueError for an unknown sort column.
     """
-    if filters and any([
-        getattr(filters, "search", None),
-        getattr(filters, "start_date", None),
-        getattr(filters, "end_date", None),
-        getattr(filters, "transaction_types", None),
-        getattr(filters, "item_types", None),
-    ]):
-        txns, _ = get_transactions_filtered(db, filters=filters, skip=0, limit=limit, sort_by=sort_by, sort_order=sort_order)
-    else:
-        txns = get_transactions(db, skip=0, limit=limit, sort_by=sort_by, sort_order=sort_order)
-
-    rows: List[Dict[str, Any]] = []
-    for t in txns:
-        # map ORM -> simple dict with fields used in CSV export
-        rows.append({
-            "id": getattr(t, "id", ""),
-            "transaction_date": getattr(t, "transaction_date", ""),
-            "transaction_type": getattr(t, "transaction_type", ""),
-            "item_type": getattr(t, "item_type", ""),
-            "item_id": getattr(t, "item_id", ""),
-            "item_name": getattr(t, "item_name", ""),
-            "unit_id": getattr(t, "unit_id", "") if hasattr(t, "unit_id") else (
-                getattr(t, "partition_id", None) or getattr(t, "large_item_id", None) or getattr(t, "container_id", None) or ""
-            ),
-            "partition_id": getattr(t, "partition_id", ""),
-            "large_item_id": getattr(t, "large_item_id", ""),
-            "container_id": getattr(t, "container_id", ""),
-            "storage_section_id": getattr(t, "storage_section_id", ""),
-            "user_name": getattr(t, "user_name", ""),
-            "previous_quantity": getattr(t, "previous_quantity", ""),
-            "current_quantity": getattr(t, "current_quantity", ""),
-            "quantity_change": getattr(t, "quantity_change", ""),
-            "previous_weight": getattr(t, "previous_weight", ""),
-            "current_weight": getattr(t, "current_weight", ""),
-            "weight_change": getattr(t, "weight_change", ""),
-            "notes": getattr(t, "notes", "") if hasattr(t, "notes") else ""
-        })
-    return rows
+    stmt = select(
+        Transaction.id,
+        Transaction.transaction_date,
+        Transaction.transaction_type,
+        Transaction.item_type,
+        Transaction.item_id,
+        Transaction.item_name,
+        func.coalesce(Transaction.partition_id, Transaction.large_item_id, Transaction.container_id, "").label("unit_id"),
+        Transaction.partition_id,
+        Transaction.large_item_id,
+        Transaction.container_id,
+        Transaction.storage_section_id,
+        Transaction.user_name,
+        Transaction.previous_quantity,
+        Transaction.current_quantity,
+        Transaction.quantity_change,
+        Transaction.previous_weight,
+        Transaction.current_weight,
+        Transaction.weight_change,
+        # transactions have no notes column; the export keeps its (always empty) notes field
+        literal("").label("notes"),
+    )
+    return _order_transactions(_apply_filters(stmt, filters), sort_by, sort_order)
+
+def get_transactions_for_export(db: Session, stmt) -> Iterator[RowMapping]:
+    """Stream a transactions_export_select as row mappings, in chunks from a server-side cursor"""
+    return db.execute(stmt.execution_options(yield_per=5000)).mappings()
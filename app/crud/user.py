@@ -1,17 +1,53 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import event, or_, select, update, delete, exists, lambda_stmt
 from app.models.user import User
+from app.crud.general import paginate_with_total
+from app.utils.cache import TTLCache
 from app.schemas.user import UserCreate, UserUpdate
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+# employeeId -> column values; users rarely change, so repeat lookups skip the database briefly.
+# Plain values are cached (not ORM instances) and every hit gets its own transient User.
+# Only found users are cached, and the cache is per process: existence checks before a write
+# must use user_exists, which always asks the database.
+_user_cache = TTLCache(ttl=5, maxsize=2048)
+_STALE_USERS = "stale_user_ids"
+
+def _mark_user_stale(db: Session, employeeid: str) -> None:
+    """Drop `employeeid` from the cache when this session's transaction commits"""
+    db.info.setdefault(_STALE_USERS, set()).add(employeeid)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users_after_commit(session):
+    # after the commit, so a concurrent reader can't re-cache the pre-commit row
+    for employeeid in session.info.pop(_STALE_USERS, ()):
+        _user_cache.invalidate(employeeid)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_users(session):
+    session.info.pop(_STALE_USERS, None)
+
+def _load_user_values(db: Session, employeeid: str) -> Optional[Dict[str, Any]]:
+    # point lookups run on most requests; lambda_stmt caches each compiled SELECT and only binds the value
+    db_user = db.execute(lambda_stmt(lambda: select(User).where(User.employeeId == employeeid))).scalar_one_or_none()
+    if db_user is None:
+        return None
+    return {column.key: getattr(db_user, column.key) for column in User.__table__.columns}
 
 def get_user(db: Session, employeeid: str) -> Optional[User]:
-    return db.query(User).filter(User.employeeId == employeeid).first()
+    values = _user_cache.get_or_set(employeeid, lambda: _load_user_values(db, employeeid), cache_none=False)
+    return User(**values) if values else None
+
+def user_exists(db: Session, employeeid: str) -> bool:
+    # uncached: another worker may have created the user since this process last looked
+    return bool(db.execute(lambda_stmt(lambda: select(exists().where(User.employeeId == employeeid)))).scalar())
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
-    return db.query(User).filter(User.email == email).first()
+    return db.execute(lambda_stmt(lambda: select(User).where(User.email == email))).scalar_one_or_none()
 
 def get_user_by_name(db: Session, name: str) -> Optional[User]:
-    return db.query(User).filter(User.name == name).first()
+    # name is not unique; keep the first match like before
+    return db.execute(lambda_stmt(lambda: select(User).where(User.name == name).limit(1))).scalars().first()
 
 def get_users(
     db: Session, 
@@ -37,40 +73,39 @@ def get_users(
         query = query.filter(User.admin == admin_filter)
     
     query = query.order_by(User.employeeId)
-    total_count = query.count()
-    
-    skip = (page - 1) * page_size
-    users = query.offset(skip).limit(page_size).all()
-    
-    return users, total_count
+    return paginate_with_total(query, page, page_size)
 
 def create_user(db: Session, user: UserCreate) -> User:
     db_user = User(**user.model_dump())
     db.add(db_user)
-    db.commit()
+    _mark_user_stale(db, db_user.employeeId)
+    # flush only; the route's get_db_tx commits once for the whole request
+    db.flush()
     db.refresh(db_user)
     return db_user
 
 def update_user(db: Session, employeeid: str, user: UserUpdate) -> Optional[User]:
-    db_user = db.query(User).filter(User.employeeId == employeeid).first()
-    if not db_user:
-        return None
-    
     update_data = user.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_user, key, value)
-    
-    db.commit()
-    db.refresh(db_user)
+    if not update_data:
+        return db.query(User).filter(User.employeeId == employeeid).first()
+
+    # single UPDATE ... RETURNING instead of load + dirty-check + flush
+    db_user = db.execute(
+        update(User).where(User.employeeId == employeeid).values(**update_data).returning(User)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).scalar_one_or_none()
+    _mark_user_stale(db, employeeid)
+    if db_user is not None:
+        _mark_user_stale(db, db_user.employeeId)
     return db_user
 
 def delete_user(db: Session, employeeid: str) -> Optional[User]:
-    db_user = db.query(User).filter(User.employeeId == employeeid).first()
-    if not db_user:
-        return None
-    
-    db.delete(db_user)
-    db.commit()
+    # single DELETE ... RETURNING hands back the removed row without loading it first
+    db_user = db.execute(
+        delete(User).where(User.employeeId == employeeid).returning(User)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).scalar_one_or_none()
+    _mark_user_stale(db, employeeid)
     return db_user
 
 def search_users_by_keyword(db: Session, keyword: str, limit: int = 20) -> List[User]:
@@ -1,6 +1,8 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import BigInteger, Index, create_engine, func, literal_column, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Depends
+from sqlalchemy.pool import NullPool
 import os
 import logging
 from dotenv import load_dotenv
@@ -18,22 +20,43 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 
+# Connection pool tuning
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0 disables
+# behind PgBouncer (transaction pooling) the bouncer owns the pool, so don't keep connections here
+DB_USE_PGBOUNCER = os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true"
+# dev/test guard: make accidental lazy loads on hot relationships raise instead of issuing a query
+DB_RAISE_ON_LAZY_LOAD = os.getenv("DB_RAISE_ON_LAZY_LOAD", "false").lower() == "true"
+# lazy= strategy for relationships crud never navigates; many-to-one targets already in the
+# identity map still resolve without SQL under raise_on_sql
+GUARDED_LAZY = "raise_on_sql" if DB_RAISE_ON_LAZY_LOAD else "select"
+
+# arbitrary app-wide key so concurrent workers serialize the existence check below
+_CREATE_DB_LOCK_KEY = 0xAD1A1
+
 # Create database if it doesn't exist
 def create_database_if_not_exists():
     server_url = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/postgres"
     
     try:
-        engine = create_engine(server_url)
-        with engine.connect() as conn:
-            # Check if database exists
-            result = conn.execute(text(f"SELECT 1 FROM pg_database WHERE datname = '{DB_NAME}'"))
-            if not result.fetchone():
-                # Create database
-                conn.execute(text("COMMIT"))
-                conn.execute(text(f"CREATE DATABASE {DB_NAME}"))
-                logger.info(f"Database '{DB_NAME}' created successfully!")
-            else:
-                logger.info(f"Database '{DB_NAME}' already exists.")
+        engine = create_engine(server_url, poolclass=NullPool)
+        # CREATE DATABASE cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            # with several uvicorn workers only one checks/creates at a time; the rest then see it exists
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _CREATE_DB_LOCK_KEY})
+            try:
+                # Check if database exists
+                result = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": DB_NAME})
+                if not result.fetchone():
+                    # Create database; the name can't be a bind parameter, so quote it as an identifier
+                    conn.execute(text(f"CREATE DATABASE {conn.dialect.identifier_preparer.quote(DB_NAME)}"))
+                    logger.info(f"Database '{DB_NAME}' created successfully!")
+                else:
+                    logger.info(f"Database '{DB_NAME}' already exists.")
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _CREATE_DB_LOCK_KEY})
+        engine.dispose()
     except Exception as e:
         logger.error(f"Error creating database: {e}")
 
@@ -43,15 +66,61 @@ create_database_if_not_exists()
 # Now connect to the specific database
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_engine(DATABASE_URL)
+if DB_USE_PGBOUNCER:
+    # PgBouncer rejects the "options" startup parameter, so no per-connection statement_timeout here
+    engine = create_engine(DATABASE_URL, query_cache_size=1200, poolclass=NullPool)
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        query_cache_size=1200,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,     # drop connections the server or a firewall closed while idle
+        pool_recycle=1800,
+        pool_use_lifo=True,     # reuse warm connections; idle extras age out via pool_recycle
+        connect_args={"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"},
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+def numeric_suffix(column):
+    """Numeric suffix of `column` as BIGINT (NULL if it has no digits)"""
+    # regexp_replace(..., '\D', '', 'g') -> digits only ('' if none)
+    # constants are rendered inline (not bound) so the expression matches the
+    # ix_<table>_id_numeric_suffix functional indexes and ORDER BY can walk them
+    return func.nullif(
+        func.regexp_replace(column, literal_column(r"'\D'"), literal_column("''"), literal_column("'g'")),
+        literal_column("''"),
+    ).cast(BigInteger)
+
+def numeric_suffix_index(tablename: str, id_column) -> Index:
+    """(numeric suffix, id) index behind order_by_numeric_suffix / filter_after_numeric_suffix"""
+    return Index(f"ix_{tablename}_id_numeric_suffix", numeric_suffix(id_column), id_column)
+
 # Dependency
+# request-scoped: the session stays open until the response has been sent (code after the yield
+# runs only then), so nothing may be committed here. Uncommitted work is rolled back on error
 def get_db():
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Unit of work for write routes: declare as Depends(get_db_tx, scope="function") so the exit code
+# runs when the endpoint returns, before the response is sent. It commits once per request on
+# success (a failed COMMIT becomes the error response) and rolls back if the endpoint raised,
+# including HTTPException. The transaction, storage section, user and RFID-create helpers only
+# flush and rely on this; helpers that still commit their own steps leave it nothing to do.
+# The session itself is still closed by get_db
+def get_db_tx(db: Session = Depends(get_db)):
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
\ No newline at end of file
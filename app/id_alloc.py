@@ -0,0 +1,60 @@
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import String, cast, event, func, literal
+from sqlalchemy.orm import Session
+
+# mapped class -> fn(target) giving (sequence name, id prefix) for a pending row
+IdSpec = Callable[[object], Tuple[str, str]]
+_SEQUENCE_IDS: Dict[type, IdSpec] = {}
+
+
+def register_sequence_id(cls: type, spec: IdSpec) -> None:
+    """Have `cls` rows get "<prefix><nextval>" ids when they are flushed"""
+    _SEQUENCE_IDS[cls] = spec
+
+
+def next_sequence_values(connection, seq_name: str, n: int) -> List[int]:
+    """Draw `n` values from `seq_name` in a single round trip"""
+    if n == 1:
+        return [connection.exec_driver_sql("SELECT nextval(%s)", (seq_name,)).scalar()]
+    return connection.exec_driver_sql(
+        "SELECT nextval(%s) FROM generate_series(1, %s)", (seq_name, n)
+    ).scalars().all()
+
+
+@event.listens_for(Session, "before_flush")
+def _allocate_sequence_ids(session, flush_context, instances):
+    """
+    Assign ids to every new registered object in the flush, one nextval round trip per
+    sequence however many rows share it. Values are drawn per flush rather than cached
+    across requests, so restarts don't leave gaps in the human-readable ids.
+    """
+    pending: Dict[Tuple[str, str], list] = defaultdict(list)
+    for obj in session.new:
+        spec = _SEQUENCE_IDS.get(type(obj))
+        if spec is not None and obj.id is None:
+            pending[spec(obj)].append(obj)
+    if not pending:
+        return
+
+    connection = session.connection()
+    for (seq_name, prefix), objs in pending.items():
+        for obj, value in zip(objs, next_sequence_values(connection, seq_name, len(objs))):
+            obj.id = f"{prefix}{int(value)}"
+
+
+def sequence_id_expressions(cls: type, rows: List[Dict[str, Any]]) -> None:
+    """
+    Set "id" on plain row dicts bound for a multi-row Core INSERT to '<prefix>' || nextval(seq),
+    so the database numbers every row inside the INSERT itself. Core inserts never go through
+    the flush hook above; classes that aren't registered keep their server-side id default.
+    """
+    spec = _SEQUENCE_IDS.get(cls)
+    if spec is None:
+        return
+    for row in rows:
+        if row.get("id") is None:
+            seq_name, prefix = spec(SimpleNamespace(**row))
+            row["id"] = literal(prefix) + cast(func.nextval(seq_name), String)
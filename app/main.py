@@ -1,37 +1,81 @@
-from fastapi import FastAPI, Depends, Request
+from contextlib import asynccontextmanager
+import string
+import anyio.to_thread
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.exception_handlers import RequestValidationError
 from app.routers import users, transaction, storage_section, rfid_tags, partition, large_item, item, container, ai_vision
-from app.security import verify_api_key
+from app.security import APIKeyMiddleware
+from app.utils.response import StaticJSON
+from app.database import DB_POOL_SIZE, DB_MAX_OVERFLOW
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # sync endpoints run in AnyIO's worker threads (40 by default); size that pool to the
+    # DB connection pool so requests queue on neither side while the other has capacity
+    anyio.to_thread.current_default_thread_limiter().total_tokens = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    yield
 
 # Create FastAPI app
 app = FastAPI(
     title="ADI AI Inventory System",
     description="Inventory Management System API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Bearer token auth for every route except the API docs
+app.add_middleware(
+    APIKeyMiddleware,
+    public_paths=(app.openapi_url, app.docs_url, app.redoc_url, app.swagger_ui_oauth2_redirect_url)
+)
+
+# Common error prefixes stripped from pydantic messages (lowercase, checked in order)
+_ERROR_PREFIXES = (
+    "value is not a valid", "value error,", "value error", "type error,", "type error",
+    "none is not an allowed value", "none is not allowed", "not a valid",
 )
 
+def _strip_error_prefix(msg: str) -> str:
+    lowered = msg.lower()
+    for prefix in _ERROR_PREFIXES:
+        if lowered.startswith(prefix):
+            return msg[len(prefix):].lstrip(":" + string.whitespace)
+    return msg
+
+def _empty_field_message(field_name: str) -> str:
+    last_field = field_name.split('.')[-1] if field_name else "Field"
+    return f"{last_field.capitalize()} cannot be empty"
+
+# pydantic error type -> final message, for types whose wording never needs the regex pass
+_MESSAGE_BY_TYPE = {
+    "string_type": _empty_field_message,
+}
+
 # Global handler for Pydantic validation errors Formatting
 @app.exception_handler(RequestValidationError)
 async def fastapi_validation_exception_handler(request: Request, exc: RequestValidationError):
-    import re
     errors = []
     for err in exc.errors():
         loc = err["loc"]
         # Remove "body" prefix if present
         if loc and loc[0] == "body":
             loc = loc[1:]
-        field_name = ".".join(str(l) for l in loc)
+        # loc is usually all field names; only list indexes need str()
+        field_name = ".".join(loc) if all(type(l) is str for l in loc) else ".".join(map(str, loc))
+        by_type = _MESSAGE_BY_TYPE.get(err["type"])
+        if by_type is not None:
+            errors.append({"field": field_name, "message": by_type(field_name)})
+            continue
         msg = err["msg"]
-        # Remove common error prefixes using regex
-        msg = re.sub(r"^(value is not a valid|Value error,|Value error|type error,|type error|none is not an allowed value|none is not allowed|not a valid)[:\s]*", "", msg, flags=re.IGNORECASE)
+        # Remove common error prefixes
+        msg = _strip_error_prefix(msg)
         # If message contains a colon, take only the part after the colon
         if ':' in msg:
             msg = msg.split(':', 1)[1].strip()
         # Replace 'input should be a valid string' with '<Field> cannot be empty'
         if msg.strip().lower() == "input should be a valid string":
-            last_field = field_name.split('.')[-1] if field_name else "Field"
-            msg = f"{last_field.capitalize()} cannot be empty"
+            msg = _empty_field_message(field_name)
         # Remove trailing punctuation and whitespace
         msg = msg.strip().rstrip('.')
         errors.append({
@@ -43,27 +87,41 @@ async def fastapi_validation_exception_handler(request: Request, exc: RequestVal
         content={"detail": errors}
     )
 
+_ROOT = StaticJSON({
+    "message": "ADI AI Inventory System API",
+    "status": "running",
+    "version": "1.0.0"
+})
+
 # Protected endpoints (require Bearer token)
-@app.get("/", dependencies=[Depends(verify_api_key)])
-def read_root():
-    return {
-        "message": "ADI AI Inventory System API",
-        "status": "running",
-        "version": "1.0.0"
-    }
+@app.get("/")
+async def read_root():
+    return _ROOT.response()
 
-# Protected routes (require Bearer token)
-app.include_router(users.router, dependencies=[Depends(verify_api_key)])
-app.include_router(transaction.router, dependencies=[Depends(verify_api_key)])
-app.include_router(storage_section.router, dependencies=[Depends(verify_api_key)])
-app.include_router(rfid_tags.router, dependencies=[Depends(verify_api_key)])
-app.include_router(partition.router, dependencies=[Depends(verify_api_key)])
-app.include_router(container.router, dependencies=[Depends(verify_api_key)])
-app.include_router(large_item.router, dependencies=[Depends(verify_api_key)])
-app.include_router(item.router, dependencies=[Depends(verify_api_key)])
-app.include_router(ai_vision.router, dependencies=[Depends(verify_api_key)])
+# Protected routes (Bearer token checked by APIKeyMiddleware)
+for _router in (
+    users.router,
+    transaction.router,
+    storage_section.router,
+    rfid_tags.router,
+    partition.router,
+    container.router,
+    large_item.router,
+    item.router,
+    ai_vision.router,
+):
+    app.include_router(_router)
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # C event loop and HTTP parser; workers need the app as an import string
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
\ No newline at end of file
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Enum, event, text
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, Enum, Index, Sequence, text
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, GUARDED_LAZY, numeric_suffix_index
 import enum
 
 class ContainerStatus(enum.Enum):
@@ -8,12 +8,19 @@ class ContainerStatus(enum.Enum):
     WITHDRAWN = "withdrawn"
 
 
+# one shared column type per enum (named like the existing Postgres ENUM), reused by every column
+CONTAINER_STATUS_TYPE = Enum(ContainerStatus, name="containerstatus")
+
+# backs the "C<n>" ids; declared on the metadata so it is created alongside the table
+containers_seq = Sequence("containers_seq", start=1, metadata=Base.metadata)
+
 class Container(Base):
     __tablename__ = "containers"
 
-    id = Column(String(20), primary_key=True, index=True)  # will be C1, C2, ...
-    item_id = Column(String(255), ForeignKey("items.id"), nullable=False, index=True)
-    storage_section_id = Column(String(255), ForeignKey("storage_sections.id"), nullable=False, index=True)
+    # C1, C2, ... generated by the database; eager_defaults reads it back via INSERT ... RETURNING
+    id = Column(String(20), primary_key=True, index=True, server_default=text("'C' || nextval('containers_seq')"))
+    item_id = Column(String(255), ForeignKey("items.id"), nullable=False)
+    storage_section_id = Column(String(255), ForeignKey("storage_sections.id"), nullable=False)
     rfid_tag_id = Column(String(255), ForeignKey("rfid_tags.id"), nullable=False, index=True)
 
     # Always store total weight of items inside this container
@@ -22,45 +29,29 @@ class Container(Base):
     # Optional manual quantity (kept in case you need explicit tracking)
     quantity = Column(Integer, nullable=True)
 
-    status = Column(Enum(ContainerStatus), nullable=False, default=ContainerStatus.AVAILABLE, index=True)
+    status = Column(CONTAINER_STATUS_TYPE, nullable=False, default=ContainerStatus.AVAILABLE)
 
-    # Relationships
-    item = relationship("Item", back_populates="containers")
-    storage_section = relationship("StorageSection", back_populates="containers")
-    rfid_tag = relationship("RFIDTag", back_populates="container")
+    # Relationships; crud loads what it needs explicitly, so with DB_RAISE_ON_LAZY_LOAD
+    # any unplanned lazy load (N+1) raises instead of silently querying
+    item = relationship("Item", back_populates="containers", lazy=GUARDED_LAZY)
+    storage_section = relationship("StorageSection", back_populates="containers", lazy=GUARDED_LAZY)
+    rfid_tag = relationship("RFIDTag", back_populates="container", lazy=GUARDED_LAZY)
 
-    @property
-    def calculated_quantity(self):
-        """
-        Returns quantity derived from items_weight // container_item_weight
-        if the referenced item defines container_item_weight.
-        """
-        if self.item and getattr(self.item, "container_item_weight", None):
-            return int(self.items_weight // self.item.container_item_weight)
-        return None
+    __table_args__ = (
+        # lookups are by item or by section, optionally narrowed by status; the leading
+        # column also serves the plain item_id / storage_section_id filters
+        Index("ix_containers_item_status", "item_id", "status"),
+        Index("ix_containers_section_status", "storage_section_id", "status"),
+        # (numeric suffix, id) for the id ordering used by the listings
+        numeric_suffix_index("containers", id),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return (
             f"<Container(id='{self.id}', "
             f"items_weight={self.items_weight}kg, "
-            f"calculated_quantity={self.calculated_quantity}, "
             f"quantity={self.quantity}, "
             f"status='{self.status.value}')>"
         )
-
-
-# Event listener to generate sequential Container IDs
-@event.listens_for(Container, "before_insert")
-def generate_container_id(mapper, connection, target):
-    prefix = "C"
-    seq_name = "containers_seq"
-
-    # create sequence if it doesn't exist (prefer to provision via migration in production)
-    try:
-        connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name} START 1"))
-    except Exception:
-        pass
-
-    # atomically get the next value
-    next_val = connection.execute(text(f"SELECT nextval('{seq_name}')")).scalar()
-    target.id = f"{prefix}{int(next_val)}"
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Integer, Enum, Float, ForeignKey, DateTime, func, event, text
+from sqlalchemy import Column, String, Integer, Enum, Float, ForeignKey, DateTime, Index, Sequence, func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, numeric_suffix_index
+from app.id_alloc import register_sequence_id
 import enum
-import uuid
 
 class ItemType(enum.Enum):
     PARTITION = "partition"
@@ -19,14 +19,19 @@ class StockStatus(enum.Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+# one shared column type per enum (named like the existing Postgres ENUM), reused by every column
+ITEM_TYPE = Enum(ItemType, name="itemtype")
+MEASURE_METHOD_TYPE = Enum(MeasureMethod, name="measuremethod")
+STOCK_STATUS_TYPE = Enum(StockStatus, name="stockstatus")
+
 class Item(Base):
     __tablename__ = "items"
 
     id = Column(String(255), primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
     manufacturer = Column(String(255), nullable=True, index=True)
-    item_type = Column(Enum(ItemType), nullable=False)
-    measure_method = Column(Enum(MeasureMethod), nullable=True)
+    item_type = Column(ITEM_TYPE, nullable=False)
+    measure_method = Column(MEASURE_METHOD_TYPE, nullable=True)
     image_path = Column(String(500), nullable=False)
 
     process = Column(String(50), nullable=False, index=True)
@@ -52,6 +57,13 @@ class Item(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+
+    __table_args__ = (
+        # trigram index so ILIKE '%term%' searches on name avoid a sequential scan (pg_trgm)
+        Index("ix_items_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        # (numeric suffix, id) for the id ordering used by the listings
+        numeric_suffix_index("items", id),
+    )
  
 # Per-type stat tables
 class PartitionStat(Base):
@@ -66,7 +78,7 @@ class PartitionStat(Base):
     high_threshold = Column(Float, nullable=False)   # percent 0-100 (required)
     low_threshold = Column(Float, nullable=False)    # percent 0-100 (required)
     # optional overall status for this stat row
-    stock_status = Column(Enum(StockStatus), nullable=False, index=True)
+    stock_status = Column(STOCK_STATUS_TYPE, nullable=False, index=True)
 
     item = relationship("Item", back_populates="partition_stat")
 
@@ -85,7 +97,7 @@ class ContainerStat(Base):
     # unified threshold names
     high_threshold = Column(Float, nullable=False)
     low_threshold = Column(Float, nullable=False)
-    stock_status = Column(Enum(StockStatus), nullable=False, index=True)
+    stock_status = Column(STOCK_STATUS_TYPE, nullable=False, index=True)
 
     item = relationship("Item", back_populates="container_stat")
 
@@ -98,7 +110,7 @@ class LargeItemStat(Base):
     total_quantity = Column(Integer, nullable=False)
     high_threshold = Column(Integer, nullable=False)
     low_threshold = Column(Integer, nullable=False)
-    stock_status = Column(Enum(StockStatus), nullable=False, index=True)
+    stock_status = Column(STOCK_STATUS_TYPE, nullable=False, index=True)
  
     item = relationship("Item", back_populates="largeitem_stat")
 
@@ -110,17 +122,16 @@ class ItemStatHistory(Base):
     id = Column(String(20), primary_key=True, index=True)
 
     # Snapshot metadata
-    timestamp = Column(DateTime, default=func.now(), nullable=False)
+    timestamp = Column(DateTime, server_default=func.now(), nullable=False)
     # reference items.id with ON DELETE CASCADE so DB will remove history when item deleted
-    item_id = Column(String(255), ForeignKey("items.id", ondelete="CASCADE"), nullable=False, index=True)
-    item_name = Column(String(255), nullable=False)
-    item_type = Column(Enum(ItemType), nullable=False)
+    item_id = Column(String(255), ForeignKey("items.id", ondelete="CASCADE"), nullable=False)
+    item_type = Column(ITEM_TYPE, nullable=False)
 
     # Snapshotted stat values
     total_quantity = Column(Integer, nullable=True)
     total_capacity = Column(Integer, nullable=True)
     total_weight = Column(Float, nullable=True)
-    stock_status = Column(Enum(StockStatus), nullable=False, index=True)
+    stock_status = Column(STOCK_STATUS_TYPE, nullable=False, index=True)
 
     # Optional metadata
     change_source = Column(String(255), nullable=True)
@@ -128,27 +139,28 @@ class ItemStatHistory(Base):
     # ORM relationship back to the Item
     item = relationship("Item", back_populates="item_stat_history", passive_deletes=True)
 
+    __table_args__ = (
+        # per-item snapshot timeline (history, latest-per-item aggregates); also serves item_id lookups
+        Index("ix_item_stat_history_item_ts", "item_id", "timestamp"),
+        # append-only time series, so a BRIN range index stays tiny for period scans
+        Index("ix_item_stat_history_timestamp_brin", "timestamp", postgresql_using="brin"),
+    )
+
     def __repr__(self):
         return f"<ItemStatHistory(id='{self.id}', item_id='{self.item_id}', timestamp={self.timestamp})>"
 
 
-# Event listener to generate short IDs for ItemStatHistory ("H-<code><n>")
-@event.listens_for(ItemStatHistory, "before_insert")
-def generate_item_stat_history_id(mapper, connection, target):
-    type_code_map = {
-        "partition": ("P", "ish_P_seq"),
-        "container": ("C", "ish_C_seq"),
-        "large_item": ("L", "ish_L_seq")
-    }
-    type_val = getattr(target.item_type, "value", target.item_type)
-    code, seq_name = type_code_map.get(type_val, ("X", "ish_X_seq"))
-    # Ensure sequence exists before selecting nextval (avoids transaction abort on SELECT failure)
-    try:
-        connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name} START 1"))
-    except Exception:
-        # best-effort: ignore if cannot create (migration-managed environments should pre-create)
-        pass
-    # now safely get next value
-    next_val = connection.execute(text(f"SELECT nextval('{seq_name}')")).scalar()
-    target.id = f"ISH-{code}{int(next_val)}"
+# per-type sequences behind the history ids; declared on the metadata (and provisioned by
+# migration) so inserts only need nextval. Unquoted names, so Postgres folds them to lowercase.
+ITEM_STAT_HISTORY_SEQUENCES = {
+    "partition": ("P", Sequence("ish_p_seq", start=1, metadata=Base.metadata)),
+    "container": ("C", Sequence("ish_c_seq", start=1, metadata=Base.metadata)),
+    "large_item": ("L", Sequence("ish_l_seq", start=1, metadata=Base.metadata)),
+}
+
+def _item_stat_history_id_spec(target):
+    code, seq = ITEM_STAT_HISTORY_SEQUENCES[getattr(target.item_type, "value", target.item_type)]
+    return seq.name, f"ISH-{code}"
 
+# short IDs for ItemStatHistory ("ISH-<code><n>"), assigned at flush
+register_sequence_id(ItemStatHistory, _item_stat_history_id_spec)
@@ -1,40 +1,42 @@
-from sqlalchemy import Column, String, ForeignKey, Enum, event, text
+from sqlalchemy import Column, String, ForeignKey, Enum, Index, Sequence, text
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, numeric_suffix_index
 import enum
 
 class LargeItemStatus(enum.Enum):
     AVAILABLE = "available"
     WITHDRAWN = "withdrawn"
 
+# one shared column type per enum (named like the existing Postgres ENUM), reused by every column
+LARGE_ITEM_STATUS_TYPE = Enum(LargeItemStatus, name="largeitemstatus")
+
+# backs the "L<n>" ids; declared on the metadata so it is created alongside the table
+large_items_seq = Sequence("large_items_seq", start=1, metadata=Base.metadata)
+
 class LargeItem(Base):
     __tablename__ = "large_items"
 
-    id = Column(String(20), primary_key=True, index=True)
-    item_id = Column(String(255), ForeignKey("items.id"), nullable=False, index=True)
-    storage_section_id = Column(String(255), ForeignKey("storage_sections.id"), nullable=False, index=True)
+    # L1, L2, ... generated by the database; eager_defaults reads it back via INSERT ... RETURNING
+    id = Column(String(20), primary_key=True, index=True, server_default=text("'L' || nextval('large_items_seq')"))
+    item_id = Column(String(255), ForeignKey("items.id"), nullable=False)
+    storage_section_id = Column(String(255), ForeignKey("storage_sections.id"), nullable=False)
     rfid_tag_id = Column(String(255), ForeignKey("rfid_tags.id"), nullable=False, index=True)
-    status = Column(Enum(LargeItemStatus), nullable=False, default=LargeItemStatus.AVAILABLE, index=True)
+    status = Column(LARGE_ITEM_STATUS_TYPE, nullable=False, default=LargeItemStatus.AVAILABLE)
     
     item = relationship("Item", back_populates="large_items")
     storage_section = relationship("StorageSection", back_populates="large_items")
     rfid_tag = relationship("RFIDTag", back_populates="large_item")
+
+    __table_args__ = (
+        # lookups are by item or by section, optionally narrowed by status; the leading
+        # column also serves the plain item_id / storage_section_id filters
+        Index("ix_large_items_item_status", "item_id", "status"),
+        Index("ix_large_items_section_status", "storage_section_id", "status"),
+        # (numeric suffix, id) for the id ordering used by the listings
+        numeric_suffix_index("large_items", id),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<LargeItem(id='{self.id}', item_id='{self.item_id}', status='{self.status.value}')>"
-
-# Event listener to generate sequential LargeItem IDs (sequence-backed, atomic)
-@event.listens_for(LargeItem, "before_insert")
-def generate_largeitem_id(mapper, connection, target):
-    prefix = "L"
-    seq_name = "large_items_seq"
-
-    # create sequence if it doesn't exist (prefer to provision via migration in production)
-    try:
-        connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name} START 1"))
-    except Exception:
-        pass
-
-    # atomically get the next value
-    next_val = connection.execute(text(f"SELECT nextval('{seq_name}')")).scalar()
-    target.id = f"{prefix}{int(next_val)}"
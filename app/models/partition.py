@@ -1,40 +1,47 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, event, text
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, Index, Sequence, text
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, numeric_suffix_index
 import enum
 
 class PartitionStatus(enum.Enum):
     AVAILABLE = "available"
     WITHDRAWN = "withdrawn"
 
+# one shared column type per enum (named like the existing Postgres ENUM), reused by every column
+PARTITION_STATUS_TYPE = Enum(PartitionStatus, name="partitionstatus")
+
+# backs the "P<n>" ids; declared on the metadata so it is created alongside the table
+partitions_seq = Sequence("partitions_seq", start=1, metadata=Base.metadata)
+
 class Partition(Base):
     __tablename__ = "partitions"
 
-    id = Column(String(20), primary_key=True, index=True)
-    item_id = Column(String(255), ForeignKey("items.id"), nullable=False, index=True)
-    storage_section_id = Column(String(255), ForeignKey("storage_sections.id"), nullable=False, index=True)
+    # P1, P2, ... generated by the database; eager_defaults reads it back via INSERT ... RETURNING
+    id = Column(String(20), primary_key=True, index=True, server_default=text("'P' || nextval('partitions_seq')"))
+    item_id = Column(String(255), ForeignKey("items.id"), nullable=False)
+    storage_section_id = Column(String(255), ForeignKey("storage_sections.id"), nullable=False)
     rfid_tag_id = Column(String(255), ForeignKey("rfid_tags.id"), nullable=False, index=True)
     
     quantity = Column(Integer, nullable=False, default=0)
-    status = Column(Enum(PartitionStatus), nullable=False, default=PartitionStatus.AVAILABLE, index=True)
+    status = Column(PARTITION_STATUS_TYPE, nullable=False, default=PartitionStatus.AVAILABLE)
     
     # Relationships
     item = relationship("Item", back_populates="partitions")
     storage_section = relationship("StorageSection", back_populates="partitions")
     rfid_tag = relationship("RFIDTag", back_populates="partition")
+
+    __table_args__ = (
+        # trigram index so ILIKE '%term%' searches on id avoid a sequential scan (pg_trgm)
+        Index("ix_partitions_id_trgm", "id", postgresql_using="gin", postgresql_ops={"id": "gin_trgm_ops"}),
+        # lookups are by item or by section, optionally narrowed by status; the leading
+        # column also serves the plain item_id / storage_section_id filters
+        Index("ix_partitions_item_status", "item_id", "status"),
+        Index("ix_partitions_section_status", "storage_section_id", "status"),
+        # (numeric suffix, id) for the id ordering used by the listings
+        numeric_suffix_index("partitions", id),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<Partition(id='{self.id}', quantity={self.quantity}, status='{self.status.value}')>"
-
-# Event listener to generate sequential Partition IDs
-@event.listens_for(Partition, "before_insert")
-def generate_partition_id(mapper, connection, target):
-    prefix = "P"
-    seq_name = "partitions_seq"
-
-    # ensure sequence exists (prefer to create via migration in production)
-    connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name} START 1"))
-
-    # atomically get next value
-    next_val = connection.execute(text(f"SELECT nextval('{seq_name}')")).scalar()
-    target.id = f"{prefix}{int(next_val)}"
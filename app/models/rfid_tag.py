@@ -1,28 +1,34 @@
-from sqlalchemy import Column, String, Boolean, event, text
+from sqlalchemy import Column, String, Boolean, Index, Sequence, text
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, GUARDED_LAZY, numeric_suffix_index
+
+# backs the "RF<n>" ids; declared on the metadata so it is created alongside the table
+rfid_seq = Sequence("rfid_seq", start=1, metadata=Base.metadata)
 
 class RFIDTag(Base):
     __tablename__ = "rfid_tags"
 
-    id = Column(String(255), primary_key=True, index=True)
+    # RF1, RF2, ... generated by the database; eager_defaults reads it back via INSERT ... RETURNING
+    id = Column(String(255), primary_key=True, index=True, server_default=text("'RF' || nextval('rfid_seq')"))
     assigned = Column(Boolean, default=False, nullable=False)
 
-    partition = relationship("Partition", back_populates="rfid_tag", uselist=False)
-    large_item = relationship("LargeItem", back_populates="rfid_tag", uselist=False)
-    container = relationship("Container", back_populates="rfid_tag", uselist=False)
+    # listings resolve the owning unit for a whole page in one UNION ALL query (crud.rfid_tag),
+    # so these back-refs are never walked per tag; DB_RAISE_ON_LAZY_LOAD turns a stray access into an error
+    partition = relationship("Partition", back_populates="rfid_tag", uselist=False, lazy=GUARDED_LAZY)
+    large_item = relationship("LargeItem", back_populates="rfid_tag", uselist=False, lazy=GUARDED_LAZY)
+    container = relationship("Container", back_populates="rfid_tag", uselist=False, lazy=GUARDED_LAZY)
+
+    __table_args__ = (
+        # trigram index so ILIKE '%term%' searches on id avoid a sequential scan (pg_trgm)
+        Index("ix_rfid_tags_id_trgm", "id", postgresql_using="gin", postgresql_ops={"id": "gin_trgm_ops"}),
+        # partial indexes so the assigned/unassigned listings read only their own subset
+        Index("ix_rfid_tags_assigned", "id", postgresql_where=text("assigned = true")),
+        Index("ix_rfid_tags_unassigned", "id", postgresql_where=text("assigned = false")),
+        # (numeric suffix, id) for the id ordering used by the listings
+        numeric_suffix_index("rfid_tags", id),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<RFIDTag(id='{self.id}', assigned={self.assigned})>"
-
-@event.listens_for(RFIDTag, "before_insert")
-def generate_rfid_id(mapper, connection, target):
-    prefix = "RF"
-    seq_name = "rfid_seq"
-
-    # ensure sequence exists (or create via migration in production)
-    connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name} START 1"))
-
-    # atomically get next value
-    next_val = connection.execute(text(f"SELECT nextval('{seq_name}')")).scalar()
-    target.id = f"{prefix}{int(next_val)}"
\ No newline at end of file
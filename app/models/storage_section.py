@@ -1,5 +1,6 @@
-from sqlalchemy import String,Enum as SQLEnum
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import String, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship, Mapped, mapped_column, query_expression
+from typing import Optional
 from app.database import Base
 from enum import Enum
 
@@ -9,19 +10,40 @@ class SectionColor(Enum):
     GREEN = "green"
     YELLOW = "yellow"
 
+# display order of section colors
+COLOR_SORT_RANK = {
+    SectionColor.RED: 1,
+    SectionColor.GREEN: 2,
+    SectionColor.BLUE: 3,
+    SectionColor.YELLOW: 4,
+}
+
+# one shared column type per enum (named like the existing Postgres ENUM), reused by every column
+SECTION_COLOR_TYPE = SQLEnum(SectionColor, name="sectioncolor")
+
 class StorageSection(Base):
     __tablename__ = "storage_sections"
 
     id: Mapped[str] = mapped_column(String(255), primary_key=True)
-    floor: Mapped[str] = mapped_column(String(50), nullable=False)
+    floor: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     cabinet: Mapped[str] = mapped_column(String(50), nullable=False) 
     layer: Mapped[str] = mapped_column(String(50), nullable=False)
-    color: Mapped[SectionColor] = mapped_column(SQLEnum(SectionColor), nullable=False)
+    color: Mapped[SectionColor] = mapped_column(SECTION_COLOR_TYPE, nullable=False)
+    # precomputed natural-order key (see generate_sort_key) so listings ORDER BY an index
+    sort_key: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)
 
     partitions = relationship("Partition", back_populates="storage_section", cascade="all, delete-orphan")
     large_items = relationship("LargeItem", back_populates="storage_section", cascade="all, delete-orphan")
     containers = relationship("Container", back_populates="storage_section")
 
+    # filled per query by crud.storage_section.with_in_use (correlated EXISTS); None when not requested
+    in_use: Mapped[Optional[bool]] = query_expression()
+
+    __table_args__ = (
+        # trigram index so ILIKE '%term%' searches on id avoid a sequential scan (pg_trgm)
+        Index("ix_storage_sections_id_trgm", "id", postgresql_using="gin", postgresql_ops={"id": "gin_trgm_ops"}),
+    )
+
 
     @staticmethod
     def generate_id(floor: str, cabinet: str, layer: str, color: str) -> str:
@@ -29,6 +51,14 @@ class StorageSection(Base):
         color_code = color.upper()[0] if color else "X"
         return f"{floor}-{cabinet}-{layer}-{color_code}"
 
+    @staticmethod
+    def generate_sort_key(floor: str, cabinet: str, layer: str, color: "SectionColor") -> str:
+        """
+        Zero-padded floor/cabinet/layer numbers plus color rank, e.g. F1-C2-L10-G -> 0000100002000102.
+        The schema validators only admit up to 5 ASCII digits per part, so the padding keeps the order.
+        """
+        return f"{int(floor[1:]):05d}{int(cabinet[1:]):05d}{int(layer[1:]):05d}{COLOR_SORT_RANK.get(color, 5)}"
+
 
     def __repr__(self):
         return f"<StorageSection(id={self.id}, floor={self.floor}, cabinet={self.cabinet}, layer={self.layer}, color={self.color.value})>"
\ No newline at end of file
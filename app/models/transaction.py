@@ -1,5 +1,7 @@
-from sqlalchemy import Column, String, Integer, Enum, DateTime, event, Float, text
-from app.database import Base
+from sqlalchemy import Column, String, Integer, Enum, DateTime, Index, Sequence, Float, Text, Computed
+from sqlalchemy.orm import deferred
+from app.database import Base, numeric_suffix_index
+from app.id_alloc import register_sequence_id
 from datetime import datetime, timezone
 import enum
 
@@ -14,13 +16,17 @@ class ItemType(enum.Enum):
     LARGE_ITEM = "large_item"
     CONTAINER = "container"
 
+# one shared column type per enum (named like the existing Postgres ENUM), reused by every column
+TRANSACTION_TYPE = Enum(TransactionType, name="transactiontype")
+ITEM_TYPE = Enum(ItemType, name="itemtype")
+
 class Transaction(Base):
     __tablename__ = "transactions"
 
     id = Column(String(20), primary_key=True, index=True)
-    transaction_type = Column(Enum(TransactionType), nullable=False, index=True)
+    transaction_type = Column(TRANSACTION_TYPE, nullable=False, index=True)
     transaction_date = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
-    item_type = Column(Enum(ItemType), nullable=False, index=True)
+    item_type = Column(ITEM_TYPE, nullable=False, index=True)
     item_id = Column(String(255), nullable=False, index=True)
     item_name = Column(String(255), nullable=False, index=True)
     
@@ -38,29 +44,56 @@ class Transaction(Base):
     weight_change = Column(Float, nullable=True) 
     
     user_name = Column(String(255), nullable=False, index=True)
+
+    # lowercased concatenation of the keyword-searchable columns, maintained by Postgres;
+    # one trigram index on it replaces six OR'ed ILIKE scans; deferred so row loads don't fetch it,
+    # raiseload so accidental attribute access fails loudly instead of issuing a SELECT per row
+    # fields are joined with chr(31) (ASCII unit separator), which never occurs in the data, so a
+    # keyword can't match across two adjacent fields the way it could across a space
+    search_blob = deferred(Column(Text, Computed(
+        "lower(coalesce(item_id, '') || chr(31) || coalesce(item_name, '') || chr(31) || coalesce(partition_id, '') || chr(31) || "
+        "coalesce(large_item_id, '') || chr(31) || coalesce(container_id, '') || chr(31) || coalesce(user_name, ''))",
+        persisted=True
+    )), raiseload=True)
+
+    __table_args__ = (
+        Index("ix_transactions_search_blob_trgm", "search_blob", postgresql_using="gin", postgresql_ops={"search_blob": "gin_trgm_ops"}),
+        # (numeric suffix, id) for the id ordering used by the listings
+        numeric_suffix_index("transactions", id),
+    )
     
     def __repr__(self):
         return f"<Transaction(id='{self.id}', type='{self.transaction_type.value}', item='{self.item_name}')>"
 
-# Event listener to generate custom IDs
-@event.listens_for(Transaction, "before_insert")
-def generate_transaction_id(mapper, connection, target):
-    # Use a DB sequence per item-type to avoid race conditions and duplicate PKs.
-    type_code_map = {
-        "partition": "P",
-        "container": "C",
-        "large_item": "L"
-    }
+# history lookups filter on one reference column and page by newest first;
+# (column, transaction_date DESC) lets them walk the index instead of sorting
+for _col in ("item_id", "partition_id", "container_id", "large_item_id", "storage_section_id", "user_name"):
+    Index(f"ix_transactions_{_col}_date", getattr(Transaction, _col), Transaction.transaction_date.desc())
+
+# short code per item type used in transaction ids (T-P1, T-C1, T-L1) and sequence names
+TRANSACTION_TYPE_CODES = {
+    "partition": "P",
+    "container": "C",
+    "large_item": "L"
+}
+
+def transaction_type_code(item_type: ItemType) -> str:
     # safe mapping from enum value to short code
-    type_code = type_code_map.get(target.item_type.value, "X")
-    seq_name = f"transactions_seq_{type_code}"
+    return TRANSACTION_TYPE_CODES.get(item_type.value, "X")
+
+# per-type sequences behind the transaction ids; declared on the metadata (and provisioned by
+# migration) so inserts only need nextval. Lowercase to match the unquoted names created before.
+TRANSACTION_SEQUENCES = {
+    code: Sequence(f"transactions_seq_{code.lower()}", start=1, metadata=Base.metadata)
+    for code in TRANSACTION_TYPE_CODES.values()
+}
 
-    # create the sequence if it doesn't exist (safe to run every time)
-    connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name}"))
+def transaction_sequence_name(type_code: str) -> str:
+    return TRANSACTION_SEQUENCES[type_code].name
 
-    # atomically get the next value
-    next_val = connection.execute(text(f"SELECT nextval('{seq_name}')")).fetchone()[0]
-    next_number = int(next_val)
+def _transaction_id_spec(target):
+    type_code = transaction_type_code(target.item_type)
+    return transaction_sequence_name(type_code), f"T-{type_code}"
 
-    # no zero-padding — just use the raw number
-    target.id = f"T-{type_code}{next_number}"
+# "T-<code><n>" ids from the item type's sequence, assigned at flush; no zero-padding
+register_sequence_id(Transaction, _transaction_id_spec)
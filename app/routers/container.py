@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
+from app.utils.response import StaticJSON, construct_response, serialized_response
 from app.crud import container as container_crud
 from app.models.container import ContainerStatus
 from app.schemas.container import (
@@ -37,30 +38,32 @@ def get_containers(
     containers, total_count = container_crud.get_containers(
         db, page=page, page_size=page_size, search=search, status=status_enum
     )
-    container_responses = [ContainerResponse.model_validate(container) for container in containers]
-    return PaginatedContainersResponse.create(
+    container_responses = [construct_response(ContainerResponse, container) for container in containers]
+    return serialized_response(PaginatedContainersResponse, PaginatedContainersResponse.create(
         containers=container_responses,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
+
+_STATUSES = StaticJSON([s.value for s in ContainerStatus])
 
 @router.get("/statuses", response_model=List[str])
-def get_container_statuses():
+async def get_container_statuses():
     """List all possible container statuses"""
-    return [s.value for s in ContainerStatus]
+    return _STATUSES.response()
 
 @router.get("/item/{item_id}", response_model=List[ContainerResponse])
 def get_containers_by_item(item_id: str, db: Session = Depends(get_db)):
     """Get all containers for a specific item"""
     containers = container_crud.get_containers_by_item(db, item_id)
-    return [ContainerResponse.model_validate(container) for container in containers]
+    return serialized_response(List[ContainerResponse], [construct_response(ContainerResponse, container) for container in containers])
 
 @router.get("/storage-section/{storage_section_id}", response_model=List[ContainerResponse])
 def get_containers_by_storage_section(storage_section_id: str, db: Session = Depends(get_db)):
     """Get all containers in a specific storage section"""
     containers = container_crud.get_containers_by_storage_section(db, storage_section_id)
-    return [ContainerResponse.model_validate(container) for container in containers]
+    return serialized_response(List[ContainerResponse], [construct_response(ContainerResponse, container) for container in containers])
 
 @router.get("/count", response_model=int)
 def get_container_count(db: Session = Depends(get_db)):
@@ -79,7 +82,7 @@ def get_container(container_id: str, db: Session = Depends(get_db)):
     return ContainerResponse.model_validate(container)
 
 @router.post("/", response_model=ContainerResponse, status_code=status.HTTP_201_CREATED)
-def create_container(container: ContainerCreate, db: Session = Depends(get_db)):
+def create_container(container: ContainerCreate, db: Session = Depends(get_db_tx, scope="function")):
     """Create new container"""
     try:
         created_container = container_crud.create_container(db=db, container=container)
@@ -91,7 +94,7 @@ def create_container(container: ContainerCreate, db: Session = Depends(get_db)):
         )
 
 @router.put("/{container_id}", response_model=ContainerResponse)
-def update_container(container_id: str, container: ContainerUpdate, db: Session = Depends(get_db)):
+def update_container(container_id: str, container: ContainerUpdate, db: Session = Depends(get_db_tx, scope="function")):
     """Update container (RFID, weight, quantity, status, etc.)"""
     try:
         updated_container = container_crud.update_container(db, container_id=container_id, container=container)
@@ -108,7 +111,7 @@ def update_container(container_id: str, container: ContainerUpdate, db: Session
         )
 
 @router.delete("/{container_id}", response_model=ContainerResponse)
-def delete_container(container_id: str, db: Session = Depends(get_db)):
+def delete_container(container_id: str, db: Session = Depends(get_db_tx, scope="function")):
     """Delete container (RFID automatically unassigned)"""
     deleted_container = container_crud.delete_container(db, container_id=container_id)
     if not deleted_container:
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import Any, Dict, List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
 from app.crud import item as item_crud
 from app.models.item import ItemType, MeasureMethod
 from app.schemas.item import (
@@ -13,6 +13,7 @@ from app.schemas.item import (
     PaginatedItemsResponse
 )
 from app.utils.image import get_image_full_path
+from app.utils.response import StaticJSON
 import logging
 import traceback
 
@@ -53,7 +54,7 @@ def get_items(
 
     base_url = get_base_url(request)
     # use CRUD helper that returns ItemStatsResponse (type-specific extra fields)
-    item_responses = [item_crud.build_item_with_stats(db, item, base_url) for item in items]
+    item_responses = item_crud.build_items_with_stats(db, items, base_url)
 
     return PaginatedItemsResponse.create(
         items=item_responses,
@@ -71,19 +72,22 @@ def search_items(
 ):
     items = item_crud.search_items_by_keyword(db, keyword=q, limit=limit)
     base_url = get_base_url(request)
-    return [item_crud.create_item_response(db, item, base_url) for item in items]
+    return [item_crud.create_item_response(db, item, base_url, refresh=False) for item in items]
 
 
 
 # ------------------ Item Types & Measure Methods ------------------ #
 
+_ITEM_TYPES = StaticJSON([t.value for t in ItemType])
+_MEASURE_METHODS = StaticJSON([m.value for m in MeasureMethod])
+
 @router.get("/types", response_model=List[str])
-def get_item_types():
-    return [t.value for t in ItemType]
+async def get_item_types():
+    return _ITEM_TYPES.response()
 
 @router.get("/measure-methods", response_model=List[str])
-def get_measure_methods():
-    return [m.value for m in MeasureMethod]
+async def get_measure_methods():
+    return _MEASURE_METHODS.response()
 
 # ------------------ Counts & Overview (must appear BEFORE the dynamic /{item_id} route) ------------------ #
 @router.get("/count/total", response_model=int)
@@ -154,19 +158,19 @@ def get_items_by_type(request: Request, item_type: str, db: Session = Depends(ge
         raise HTTPException(status_code=400, detail={"field": "item_type", "message": f"Invalid item type. Must be one of {[t.value for t in ItemType]}"})
     items = item_crud.get_items_by_type(db, item_type_enum)
     base_url = get_base_url(request)
-    return [item_crud.create_item_response(db, item, base_url) for item in items]
+    return [item_crud.create_item_response(db, item, base_url, refresh=False) for item in items]
 
 @router.get("/manufacturer/{manufacturer}", response_model=List[ItemResponse])
 def get_items_by_manufacturer(request: Request, manufacturer: str, db: Session = Depends(get_db)):
     items = item_crud.get_items_by_manufacturer(db, manufacturer)
     base_url = get_base_url(request)
-    return [item_crud.create_item_response(db, item, base_url) for item in items]
+    return [item_crud.create_item_response(db, item, base_url, refresh=False) for item in items]
 
 
 # ------------------ Create / Update / Delete ------------------ #
 
 @router.post("/", response_model=ItemResponse, status_code=201)
-def create_item(request: Request, item: ItemCreate, db: Session = Depends(get_db)):
+def create_item(request: Request, item: ItemCreate, db: Session = Depends(get_db_tx, scope="function")):
     # process validated by schema; ensure uppercase and no spaces
     process = item.process.strip().upper()
     # combine for stored name
@@ -193,7 +197,7 @@ def create_item(request: Request, item: ItemCreate, db: Session = Depends(get_db
     return item_crud.create_item_response(db, created_item, base_url)
 
 @router.put("/{item_id}", response_model=ItemResponse)
-def update_item(request: Request, item_id: str, item: ItemUpdate, db: Session = Depends(get_db)):
+def update_item(request: Request, item_id: str, item: ItemUpdate, db: Session = Depends(get_db_tx, scope="function")):
     update_payload = item.model_dump(exclude_unset=True)
 
     # If the following fields are omitted in the payload, explicitly set them to NULL in DB
@@ -245,7 +249,7 @@ def update_item(request: Request, item_id: str, item: ItemUpdate, db: Session =
     return item_crud.create_item_response(db, updated_item, base_url)
 
 @router.delete("/{item_id}", response_model=ItemResponse)
-def delete_item(request: Request, item_id: str, db: Session = Depends(get_db)):
+def delete_item(request: Request, item_id: str, db: Session = Depends(get_db_tx, scope="function")):
     try:
         deleted_item = item_crud.delete_item(db, item_id)
         if not deleted_item:
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status as http_status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
+from app.utils.response import StaticJSON, construct_response, serialized_response
 from app.crud import large_item as large_item_crud
 from app.models.large_item import LargeItemStatus
 from app.schemas.large_item import (
@@ -39,31 +40,33 @@ def get_large_items(
         db, page=page, page_size=page_size, search=search, status=status_enum
     )
     
-    large_item_responses = [LargeItemResponse.model_validate(li) for li in large_items]
+    large_item_responses = [construct_response(LargeItemResponse, li) for li in large_items]
     
-    return PaginatedLargeItemsResponse.create(
+    return serialized_response(PaginatedLargeItemsResponse, PaginatedLargeItemsResponse.create(
         large_items=large_item_responses,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
+
+_STATUSES = StaticJSON([s.value for s in LargeItemStatus])
 
 @router.get("/statuses", response_model=List[str])
-def get_large_item_statuses():
+async def get_large_item_statuses():
     """Get available large item statuses"""
-    return [s.value for s in LargeItemStatus]
+    return _STATUSES.response()
 
 @router.get("/item/{item_id}", response_model=List[LargeItemResponse])
 def get_large_items_by_item(item_id: str, db: Session = Depends(get_db)):
     """Get all large items for a specific item"""
     large_items = large_item_crud.get_large_items_by_item(db, item_id)
-    return [LargeItemResponse.model_validate(li) for li in large_items]
+    return serialized_response(List[LargeItemResponse], [construct_response(LargeItemResponse, li) for li in large_items])
 
 @router.get("/storage-section/{storage_section_id}", response_model=List[LargeItemResponse])
 def get_large_items_by_storage_section(storage_section_id: str, db: Session = Depends(get_db)):
     """Get all large items in a storage section"""
     large_items = large_item_crud.get_large_items_by_storage_section(db, storage_section_id)
-    return [LargeItemResponse.model_validate(li) for li in large_items]
+    return serialized_response(List[LargeItemResponse], [construct_response(LargeItemResponse, li) for li in large_items])
 
 @router.get("/count", response_model=int)
 def get_large_item_count(db: Session = Depends(get_db)):
@@ -82,7 +85,7 @@ def get_large_item(large_item_id: str, db: Session = Depends(get_db)):
     return LargeItemResponse.model_validate(large_item)
 
 @router.post("/", response_model=LargeItemResponse, status_code=http_status.HTTP_201_CREATED)
-def create_large_item(large_item: LargeItemCreate, db: Session = Depends(get_db)):
+def create_large_item(large_item: LargeItemCreate, db: Session = Depends(get_db_tx, scope="function")):
     """Create new large item"""
     try:
         created_li = large_item_crud.create_large_item(db=db, large_item=large_item)
@@ -94,7 +97,7 @@ def create_large_item(large_item: LargeItemCreate, db: Session = Depends(get_db)
         )
 
 @router.put("/{large_item_id}", response_model=LargeItemResponse)
-def update_large_item(large_item_id: str, large_item: LargeItemUpdate, db: Session = Depends(get_db)):
+def update_large_item(large_item_id: str, large_item: LargeItemUpdate, db: Session = Depends(get_db_tx, scope="function")):
     """Update large item (item, RFID, status, etc.)"""
     try:
         updated_li = large_item_crud.update_large_item(db, large_item_id, large_item)
@@ -111,7 +114,7 @@ def update_large_item(large_item_id: str, large_item: LargeItemUpdate, db: Sessi
         )
 
 @router.delete("/{large_item_id}", response_model=LargeItemResponse)
-def delete_large_item(large_item_id: str, db: Session = Depends(get_db)):
+def delete_large_item(large_item_id: str, db: Session = Depends(get_db_tx, scope="function")):
     """Delete large item (RFID automatically unassigned)"""
     deleted_li = large_item_crud.delete_large_item(db, large_item_id)
     if not deleted_li:
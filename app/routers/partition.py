@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
+from app.utils.response import StaticJSON, construct_response, serialized_response
 from app.crud import partition as partition_crud
 from app.models.partition import PartitionStatus
 from app.schemas.partition import (
@@ -22,6 +23,7 @@ def get_partitions(
     page_size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
     status: Optional[str] = Query(None, description="Filter by status"),
+    after: Optional[str] = Query(None, description="Cursor: return partitions after this partition ID (keyset pagination)"),
     db: Session = Depends(get_db)
 ):
     """Get partitions with pagination and filtering"""
@@ -35,35 +37,39 @@ def get_partitions(
                 detail={"field": "status", "message": f"Invalid status. Must be one of: {[s.value for s in PartitionStatus]}"}
             )
     
-    partitions, total_count = partition_crud.get_partitions(
-        db, page=page, page_size=page_size, search=search, status=status_enum
+    partitions, total_count, next_cursor = partition_crud.get_partitions(
+        db, page=page, page_size=page_size, search=search, status=status_enum, after=after
     )
     
-    partition_responses = [PartitionResponse.model_validate(p) for p in partitions]
+    partition_responses = [construct_response(PartitionResponse, p) for p in partitions]
     
-    return PaginatedPartitionsResponse.create(
+    return serialized_response(PaginatedPartitionsResponse, PaginatedPartitionsResponse.create(
         partitions=partition_responses,
         total_count=total_count,
         page=page,
-        page_size=page_size
-    )
+        page_size=page_size,
+        next_cursor=next_cursor,
+        after=after
+    ))
+
+_STATUSES = StaticJSON([s.value for s in PartitionStatus])
 
 @router.get("/statuses", response_model=List[str])
-def get_partition_statuses():
+async def get_partition_statuses():
     """Get available partition statuses"""
-    return [s.value for s in PartitionStatus]
+    return _STATUSES.response()
 
 @router.get("/item/{item_id}", response_model=List[PartitionResponse])
 def get_partitions_by_item(item_id: str, db: Session = Depends(get_db)):
     """Get all partitions for a specific item"""
     partitions = partition_crud.get_partitions_by_item(db, item_id)
-    return [PartitionResponse.model_validate(p) for p in partitions]
+    return serialized_response(List[PartitionResponse], [construct_response(PartitionResponse, p) for p in partitions])
 
 @router.get("/storage-section/{storage_section_id}", response_model=List[PartitionResponse])
 def get_partitions_by_storage_section(storage_section_id: str, db: Session = Depends(get_db)):
     """Get all partitions in a storage section"""
     partitions = partition_crud.get_partitions_by_storage_section(db, storage_section_id)
-    return [PartitionResponse.model_validate(p) for p in partitions]
+    return serialized_response(List[PartitionResponse], [construct_response(PartitionResponse, p) for p in partitions])
 
 @router.get("/count", response_model=int)
 def get_partition_count(db: Session = Depends(get_db)):
@@ -82,7 +88,7 @@ def get_partition(partition_id: str, db: Session = Depends(get_db)):
     return PartitionResponse.model_validate(partition)
 
 @router.post("/", response_model=PartitionResponse, status_code=status.HTTP_201_CREATED)
-def create_partition(partition: PartitionCreate, db: Session = Depends(get_db)):
+def create_partition(partition: PartitionCreate, db: Session = Depends(get_db_tx, scope="function")):
     """Create new partition"""
     try:
         created_partition = partition_crud.create_partition(db, partition)
@@ -91,7 +97,7 @@ def create_partition(partition: PartitionCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.put("/{partition_id}", response_model=PartitionResponse)
-def update_partition(partition_id: str, partition: PartitionUpdate, db: Session = Depends(get_db)):
+def update_partition(partition_id: str, partition: PartitionUpdate, db: Session = Depends(get_db_tx, scope="function")):
     """Update partition (RFID, status, quantity, etc.)"""
     try:
         updated_partition = partition_crud.update_partition(db, partition_id, partition)
@@ -105,7 +111,7 @@ def update_partition(partition_id: str, partition: PartitionUpdate, db: Session
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"field": "partition_id", "message": str(e)})
 
 @router.delete("/{partition_id}", response_model=PartitionResponse)
-def delete_partition(partition_id: str, db: Session = Depends(get_db)):
+def delete_partition(partition_id: str, db: Session = Depends(get_db_tx, scope="function")):
     """Delete partition (RFID automatically unassigned)"""
     deleted_partition = partition_crud.delete_partition(db, partition_id)
     if not deleted_partition:
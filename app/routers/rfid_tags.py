@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
+from app.utils.response import construct_response, serialized_response
 from app.crud import rfid_tag as rfid_crud
 from app.schemas.rfid_tag import (
     RFIDTagUpdate, 
     RFIDTagResponse,
+    RFIDTagBulkRequest,
     PaginatedRFIDTagsResponse
 )
 
@@ -20,25 +22,29 @@ def get_rfid_tags(
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     search: Optional[str] = Query(None, description="Search by tag ID"),
     assigned: Optional[bool] = Query(None, description="Filter by assignment status (true/false)"),
+    after: Optional[str] = Query(None, description="Cursor: return tags after this tag ID (keyset pagination)"),
     db: Session = Depends(get_db)
 ):
     """Get RFID tags with pagination and search"""
-    tags, total_count = rfid_crud.get_rfid_tags(
+    tags, total_count, next_cursor = rfid_crud.get_rfid_tags(
         db, 
         page=page, 
         page_size=page_size, 
         search=search,
-        assigned_filter=assigned
+        assigned_filter=assigned,
+        after=after
     )
     
-    tag_responses = [RFIDTagResponse.model_validate(tag) for tag in tags]
+    tag_responses = [construct_response(RFIDTagResponse, tag) for tag in tags]
     
-    return PaginatedRFIDTagsResponse.create(
+    return serialized_response(PaginatedRFIDTagsResponse, PaginatedRFIDTagsResponse.create(
         tags=tag_responses,
         total_count=total_count,
         page=page,
-        page_size=page_size
-    )
+        page_size=page_size,
+        next_cursor=next_cursor,
+        after=after
+    ))
 
 @router.get("/search", response_model=List[RFIDTagResponse])
 def search_rfid_tags(
@@ -48,19 +54,27 @@ def search_rfid_tags(
 ):
     """Quick search RFID tags for autocomplete/dropdown"""
     tags = rfid_crud.search_rfid_tags_by_keyword(db, keyword=q, limit=limit)
-    return [RFIDTagResponse.model_validate(tag) for tag in tags]
+    return serialized_response(List[RFIDTagResponse], [construct_response(RFIDTagResponse, tag) for tag in tags])
 
 @router.get("/assigned", response_model=List[RFIDTagResponse])
-def get_assigned_rfid_tags(db: Session = Depends(get_db)):
+def get_assigned_rfid_tags(
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum results; all when omitted"),
+    db: Session = Depends(get_db)
+):
     """Get all assigned RFID tags"""
-    tags = rfid_crud.get_assigned_rfid_tags(db)
-    return [RFIDTagResponse.model_validate(tag) for tag in tags]
+    tags = rfid_crud.get_assigned_rfid_tags(db, skip=skip, limit=limit)
+    return serialized_response(List[RFIDTagResponse], [construct_response(RFIDTagResponse, tag) for tag in tags])
 
 @router.get("/unassigned", response_model=List[RFIDTagResponse])
-def get_unassigned_rfid_tags(db: Session = Depends(get_db)):
+def get_unassigned_rfid_tags(
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum results; all when omitted"),
+    db: Session = Depends(get_db)
+):
     """Get all unassigned RFID tags"""
-    tags = rfid_crud.get_unassigned_rfid_tags(db)
-    return [RFIDTagResponse.model_validate(tag) for tag in tags]
+    tags = rfid_crud.get_unassigned_rfid_tags(db, skip=skip, limit=limit)
+    return serialized_response(List[RFIDTagResponse], [construct_response(RFIDTagResponse, tag) for tag in tags])
 
 @router.get("/{tag_id}", response_model=RFIDTagResponse)
 def get_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
@@ -74,12 +88,12 @@ def get_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
     return tag
 
 @router.post("/", response_model=RFIDTagResponse, status_code=status.HTTP_201_CREATED)
-def create_rfid_tag(db: Session = Depends(get_db)):
+def create_rfid_tag(db: Session = Depends(get_db_tx, scope="function")):
     """Create new RFID tag with auto-generated ID"""
     return rfid_crud.create_rfid_tag(db=db)
 
 @router.put("/{tag_id}", response_model=RFIDTagResponse)
-def update_rfid_tag(tag_id: str, tag: RFIDTagUpdate, db: Session = Depends(get_db)):
+def update_rfid_tag(tag_id: str, tag: RFIDTagUpdate, db: Session = Depends(get_db_tx, scope="function")):
     """Update RFID tag"""
     updated_tag = rfid_crud.update_rfid_tag(db, tag_id=tag_id, tag=tag)
     if not updated_tag:
@@ -90,7 +104,7 @@ def update_rfid_tag(tag_id: str, tag: RFIDTagUpdate, db: Session = Depends(get_d
     return updated_tag
 
 @router.delete("/{tag_id}", response_model=RFIDTagResponse)
-def delete_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
+def delete_rfid_tag(tag_id: str, db: Session = Depends(get_db_tx, scope="function")):
     """Delete RFID tag"""
     try:
         deleted_tag = rfid_crud.delete_rfid_tag(db, tag_id=tag_id)
@@ -106,8 +120,18 @@ def delete_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
             detail={"field": "tag_id", "message": str(e)}
         )
 
+@router.post("/assign-bulk", response_model=List[RFIDTagResponse])
+def assign_rfid_tags_bulk(payload: RFIDTagBulkRequest, db: Session = Depends(get_db_tx, scope="function")):
+    """Assign multiple RFID tags; returns only the tags that were changed"""
+    return rfid_crud.assign_rfid_tags_bulk(db, tag_ids=payload.tag_ids)
+
+@router.post("/unassign-bulk", response_model=List[RFIDTagResponse])
+def unassign_rfid_tags_bulk(payload: RFIDTagBulkRequest, db: Session = Depends(get_db_tx, scope="function")):
+    """Unassign multiple RFID tags; returns only the tags that were changed"""
+    return rfid_crud.unassign_rfid_tags_bulk(db, tag_ids=payload.tag_ids)
+
 @router.post("/{tag_id}/assign", response_model=RFIDTagResponse)
-def assign_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
+def assign_rfid_tag(tag_id: str, db: Session = Depends(get_db_tx, scope="function")):
     """Assign RFID tag"""
     tag = rfid_crud.assign_rfid_tag(db, tag_id=tag_id)
     if not tag:
@@ -118,7 +142,7 @@ def assign_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
     return tag
 
 @router.post("/{tag_id}/unassign", response_model=RFIDTagResponse)
-def unassign_rfid_tag(tag_id: str, db: Session = Depends(get_db)):
+def unassign_rfid_tag(tag_id: str, db: Session = Depends(get_db_tx, scope="function")):
     """Unassign RFID tag"""
     tag = rfid_crud.unassign_rfid_tag(db, tag_id=tag_id)
     if not tag:
@@ -153,6 +177,12 @@ def get_unassigned_tag_count(db: Session = Depends(get_db)):
     """Get unassigned tag count"""
     return rfid_crud.get_unassigned_tag_count(db)
 
+@router.get("/count/summary", response_model=dict)
+def get_rfid_tag_counts(db: Session = Depends(get_db)):
+    """Get total, assigned and unassigned tag counts in one call"""
+    total, assigned, unassigned = rfid_crud.get_rfid_tag_counts(db)
+    return {"total": total, "assigned": assigned, "unassigned": unassigned}
+
 # Ceck whether a unit exists for a given RFID tag
 @router.get("/unit/{rfidtag}", response_model=dict)
 def get_unit_by_rfid_tag(rfidtag: str, db: Session = Depends(get_db)):
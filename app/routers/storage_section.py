@@ -1,12 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
+from app.utils.response import StaticJSON
 from app.crud import storage_section as section_crud
 from app.models.storage_section import SectionColor, StorageSection
-from app.models.container import Container
-from app.models.partition import Partition
-from app.models.large_item import LargeItem
 from app.schemas.storage_section import (
     StorageSectionCreate, 
     StorageSectionUpdate, 
@@ -20,11 +18,7 @@ router = APIRouter(
 )
 
 def is_section_referenced(db: Session, section_id: str) -> bool:
-    return (
-        db.query(Container).filter(Container.storage_section_id == section_id).first() or
-        db.query(Partition).filter(Partition.storage_section_id == section_id).first() or
-        db.query(LargeItem).filter(LargeItem.storage_section_id == section_id).first()
-    )
+    return section_crud.is_storage_section_in_use(db, section_id)
 
 @router.get("/", response_model=PaginatedStorageSectionsResponse)
 def get_storage_sections(
@@ -54,7 +48,8 @@ def get_storage_sections(
         search=search,
         floor=floor,
         cabinet=cabinet,
-        color=color_enum
+        color=color_enum,
+        load_in_use=True  # in_use comes back as a column instead of loading the children
     )
     
     section_responses = [StorageSectionResponse.model_validate(section) for section in sections]
@@ -73,18 +68,20 @@ def search_storage_sections(
     db: Session = Depends(get_db)
 ):
     """Quick search storage sections for autocomplete/dropdown"""
-    sections = section_crud.search_storage_sections_by_keyword(db, keyword=q, limit=limit)
+    sections = section_crud.search_storage_sections_by_keyword(db, keyword=q, limit=limit, load_in_use=True)
     return [StorageSectionResponse.model_validate(section) for section in sections]
 
+_COLORS = StaticJSON([color.value for color in SectionColor])
+
 @router.get("/colors", response_model=List[str])
-def get_available_colors():
+async def get_available_colors():
     """Get list of available colors"""
-    return [color.value for color in SectionColor]
+    return _COLORS.response()
 
 @router.get("/floors/{floor}", response_model=List[StorageSectionResponse])
 def get_sections_by_floor(floor: str, db: Session = Depends(get_db)):
     """Get all sections on a specific floor"""
-    sections = section_crud.get_sections_by_floor(db, floor)
+    sections = section_crud.get_sections_by_floor(db, floor, load_in_use=True)
     return [StorageSectionResponse.model_validate(section) for section in sections]
 
 @router.get("/colors/{color}", response_model=List[StorageSectionResponse])
@@ -101,7 +98,7 @@ def get_sections_by_color(
             detail={"field": "color", "message": f"Invalid color. Must be one of: {[c.value for c in SectionColor]}"}
         )
     
-    sections = section_crud.get_sections_by_color(db, color_enum)
+    sections = section_crud.get_sections_by_color(db, color_enum, load_in_use=True)
     return [StorageSectionResponse.model_validate(section) for section in sections]
 
 @router.get("/{section_id}", response_model=StorageSectionResponse)
@@ -116,7 +113,7 @@ def get_storage_section(section_id: str, db: Session = Depends(get_db)):
     return StorageSectionResponse.model_validate(section)
 
 @router.post("/", response_model=StorageSectionResponse, status_code=status.HTTP_201_CREATED)
-def create_storage_section(section: StorageSectionCreate, db: Session = Depends(get_db)):
+def create_storage_section(section: StorageSectionCreate, db: Session = Depends(get_db_tx, scope="function")):
     """Create new storage section"""
     section_id = StorageSection.generate_id(
         section.floor, section.cabinet, section.layer, section.color.value
@@ -131,7 +128,7 @@ def create_storage_section(section: StorageSectionCreate, db: Session = Depends(
     return StorageSectionResponse.model_validate(created_section)
 
 @router.put("/{section_id}", response_model=StorageSectionResponse)
-def update_storage_section(section_id: str, section: StorageSectionUpdate, db: Session = Depends(get_db)):
+def update_storage_section(section_id: str, section: StorageSectionUpdate, db: Session = Depends(get_db_tx, scope="function")):
     """Update storage section"""
     # Generate the new ID from the updated attributes
     new_id = StorageSection.generate_id(
@@ -159,7 +156,7 @@ def update_storage_section(section_id: str, section: StorageSectionUpdate, db: S
         )
 
 @router.delete("/{section_id}", response_model=StorageSectionResponse)
-def delete_storage_section(section_id: str, db: Session = Depends(get_db)):
+def delete_storage_section(section_id: str, db: Session = Depends(get_db_tx, scope="function")):
     if is_section_referenced(db, section_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-from app.database import get_db
+from app.database import SessionLocal, get_db, get_db_tx
 from app.crud import transaction as transaction_crud
 from app.schemas.transaction import (
     TransactionCreate, 
@@ -46,15 +46,15 @@ def get_transactions(
 ):
     skip = (page - 1) * page_size
 
-    # If any filter/search provided use the filtered CRUD which returns (transactions, total_count)
-    if any([search, start_date, end_date, transaction_types, item_types]):
-        filters = TransactionFilter(
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            transaction_types=transaction_types,
-            item_types=item_types
-        )
+    # the filtered CRUD returns (transactions, total_count) in one query; with no filters it matches everything
+    filters = TransactionFilter(
+        search=search,
+        start_date=start_date,
+        end_date=end_date,
+        transaction_types=transaction_types,
+        item_types=item_types
+    )
+    try:
         transactions, total_count = transaction_crud.get_transactions_filtered(
             db,
             filters=filters,
@@ -63,9 +63,8 @@ def get_transactions(
             sort_by=sort_by,
             sort_order=sort_order
         )
-    else:
-        transactions = transaction_crud.get_transactions(db, skip=skip, limit=page_size, sort_by=sort_by, sort_order=sort_order)
-        total_count = transaction_crud.get_transaction_count(db)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return _paginate_response(transactions, total_count, page, page_size)
 
@@ -83,7 +82,6 @@ def export_transactions_csv(
     end_date: Optional[datetime] = Query(None, description="Filter transactions up to this datetime (inclusive)"),
     transaction_types: Optional[List[TransactionType]] = Query(None, description="Filter by transaction types"),
     item_types: Optional[List[ItemType]] = Query(None, description="Filter by item types"),
-    db: Session = Depends(get_db),
 ):
     """
     Export transactions matching the same filters as the list endpoint.
@@ -99,7 +97,10 @@ def export_transactions_csv(
             item_types=item_types
         )
 
-    rows = transaction_crud.get_transactions_for_export(db, filters=filters, sort_by=sort_by, sort_order=sort_order)
+    try:
+        stmt = transaction_crud.transactions_export_select(filters=filters, sort_by=sort_by, sort_order=sort_order)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     headers = [
         "id", "transaction_date", "transaction_type", "item_type", "item_id", "item_name",
@@ -114,11 +115,14 @@ def export_transactions_csv(
         writer.writerow(headers)
         yield buf.getvalue()
         buf.seek(0); buf.truncate(0)
-        for r in rows:
-            out = [r.get(h, "") for h in headers]
-            writer.writerow(out)
-            yield buf.getvalue()
-            buf.seek(0); buf.truncate(0)
+        # the body is sent after the endpoint returns, so the generator reads through a session it
+        # owns rather than a request-scoped one. Rows come from a server-side cursor in yield_per
+        # batches; write and send one chunk per batch rather than per row
+        with SessionLocal() as session:
+            for batch in transaction_crud.get_transactions_for_export(session, stmt).partitions():
+                writer.writerows([r[h] for h in headers] for r in batch)
+                yield buf.getvalue()
+                buf.seek(0); buf.truncate(0)
 
     stamp = _dt.utcnow().strftime("%Y%m%dT%H%M%SZ")
     filename = f"transactions_{stamp}.csv"
@@ -134,7 +138,10 @@ def get_filtered_transactions(
     db: Session = Depends(get_db)
 ):
     skip = (page - 1) * page_size
-    transactions, total_count = transaction_crud.get_transactions_filtered(db, filters=filters, skip=skip, limit=page_size, sort_by=sort_by, sort_order=sort_order)
+    try:
+        transactions, total_count = transaction_crud.get_transactions_filtered(db, filters=filters, skip=skip, limit=page_size, sort_by=sort_by, sort_order=sort_order)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return _paginate_response(transactions, total_count, page, page_size)
 
 @router.get("/recent", response_model=List[TransactionResponse])
@@ -143,8 +150,7 @@ def get_recent_transactions(
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
-    transactions = transaction_crud.get_recent_transactions(db, days=days, limit=limit)
-    return [TransactionResponse.model_validate(txn, from_attributes=True) for txn in transactions]
+    return transaction_crud.get_recent_transactions(db, days=days, limit=limit)
 
 @router.get("/stats", response_model=TransactionStats)
 def get_transaction_statistics(
@@ -216,26 +222,21 @@ def get_transaction(transaction_id: str, db: Session = Depends(get_db)):
 @router.post("/bulk", response_model=List[TransactionResponse], status_code=status.HTTP_201_CREATED)
 def create_transactions_bulk(
     transactions: List[TransactionCreate] = Body(...),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_tx, scope="function")
 ):
     """Create multiple transactions in a single API call"""
-    created_transactions = []
-
-    for txn in transactions:
-        created_txn = transaction_crud.create_transaction(db=db, transaction=txn)
-        created_transactions.append(TransactionResponse.model_validate(created_txn, from_attributes=True))
-
-    return created_transactions
+    created_transactions = transaction_crud.create_transactions_bulk(db=db, transactions=transactions)
+    return [TransactionResponse.model_validate(txn, from_attributes=True) for txn in created_transactions]
 
 # Create transaction
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
-def create_transaction(transaction: TransactionCreate, db: Session = Depends(get_db)):
+def create_transaction(transaction: TransactionCreate, db: Session = Depends(get_db_tx, scope="function")):
     created_transaction = transaction_crud.create_transaction(db=db, transaction=transaction)
     return TransactionResponse.model_validate(created_transaction, from_attributes=True)
 
 # Delete transaction
 @router.delete("/{transaction_id}", response_model=dict)
-def delete_transaction(transaction_id: str, db: Session = Depends(get_db)):
+def delete_transaction(transaction_id: str, db: Session = Depends(get_db_tx, scope="function")):
     deleted = transaction_crud.delete_transaction(db, transaction_id=transaction_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"field": "transaction_id", "message": "Transaction not found"})
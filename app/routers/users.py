@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_db_tx
+from app.utils.response import construct_response, serialized_response
 from app.crud import user as user_crud
 from app.schemas.user import (
     UserCreate, 
@@ -32,14 +33,14 @@ def get_users(
         admin_filter=admin
     )
     
-    user_responses = [UserResponse.model_validate(user) for user in users]
+    user_responses = [construct_response(UserResponse, user) for user in users]
     
-    return PaginatedUsersResponse.create(
+    return serialized_response(PaginatedUsersResponse, PaginatedUsersResponse.create(
         users=user_responses,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 @router.get("/search", response_model=List[UserResponse])
 def search_users(
@@ -49,13 +50,13 @@ def search_users(
 ):
     """Quick search users for autocomplete/dropdown"""
     users = user_crud.search_users_by_keyword(db, keyword=q, limit=limit)
-    return [UserResponse.model_validate(user) for user in users]
+    return serialized_response(List[UserResponse], [construct_response(UserResponse, user) for user in users])
 
 @router.get("/admins", response_model=List[UserResponse])
 def get_admin_users(db: Session = Depends(get_db)):
     """Get all admin users"""
     users = user_crud.get_admin_users(db)
-    return [UserResponse.model_validate(user) for user in users]
+    return serialized_response(List[UserResponse], [construct_response(UserResponse, user) for user in users])
 
 @router.get("/{employeeId}", response_model=UserResponse)
 def get_user(employeeId: str, db: Session = Depends(get_db)):
@@ -69,9 +70,9 @@ def get_user(employeeId: str, db: Session = Depends(get_db)):
     return UserResponse.model_validate(user)
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
+def create_user(user: UserCreate, db: Session = Depends(get_db_tx, scope="function")):
     """Create new user"""
-    if user_crud.get_user(db, employeeid=user.employeeId):
+    if user_crud.user_exists(db, employeeid=user.employeeId):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=[{"field": "employeeId", "message": "User with this employee ID already exists"}]
@@ -86,11 +87,11 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     return UserResponse.model_validate(created_user)
 
 @router.put("/{employeeId}", response_model=UserResponse)
-def update_user(employeeId: str, user: UserUpdate, db: Session = Depends(get_db)):
+def update_user(employeeId: str, user: UserUpdate, db: Session = Depends(get_db_tx, scope="function")):
     """Update user"""
     # Check if changing employeeId and new one already exists
     if user.employeeId and user.employeeId != employeeId:
-        if user_crud.get_user(db, employeeid=user.employeeId):
+        if user_crud.user_exists(db, employeeid=user.employeeId):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=[{"field": "employeeId", "message": "User with this employee ID already exists"}]
@@ -112,7 +113,7 @@ def update_user(employeeId: str, user: UserUpdate, db: Session = Depends(get_db)
     return UserResponse.model_validate(updated_user)
 
 @router.delete("/{employeeId}", response_model=UserResponse)
-def delete_user(employeeId: str, db: Session = Depends(get_db)):
+def delete_user(employeeId: str, db: Session = Depends(get_db_tx, scope="function")):
     """Delete user"""
     deleted_user = user_crud.delete_user(db, employeeid=employeeId)
     if not deleted_user:
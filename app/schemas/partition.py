@@ -129,15 +129,27 @@ class PartitionResponse(PartitionBase):
 
 class PaginatedPartitionsResponse(BaseModel):
     partitions: List[PartitionResponse]
-    total_partitions: int
+    total_partitions: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(cls, partitions: List[PartitionResponse], total_count: int, page: int, page_size: int):
+    def create(cls, partitions: List[PartitionResponse], total_count: Optional[int], page: int, page_size: int, next_cursor: Optional[str] = None, after: Optional[str] = None):
+        # keyset mode (after cursor) skips the count, so totals are left empty
+        if total_count is None:
+            return cls(
+                partitions=partitions,
+                page=page,
+                page_size=page_size,
+                has_next=next_cursor is not None,
+                has_previous=after is not None,
+                next_cursor=next_cursor
+            )
+
         total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
         
         return cls(
@@ -147,5 +159,6 @@ class PaginatedPartitionsResponse(BaseModel):
             page_size=page_size,
             total_pages=total_pages,
             has_next=page < total_pages,
-            has_previous=page > 1
+            has_previous=page > 1,
+            next_cursor=next_cursor
         )
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, field_validator
 from typing import List, Optional
 import math
-from app.validators import boolean_validator
+from app.validators import boolean_validator, non_empty_string_validator
 
 class RFIDTagBase(BaseModel):
     id: str
@@ -18,6 +18,16 @@ class RFIDTagUpdate(BaseModel):
     def validate_assigned(cls, v: bool) -> bool:
         return boolean_validator("Assigned")(v)
 
+class RFIDTagBulkRequest(BaseModel):
+    tag_ids: List[str]
+
+    @field_validator('tag_ids')
+    @classmethod
+    def validate_tag_ids(cls, v: List[str]) -> List[str]:
+        if not v:
+            raise ValueError('Tag IDs cannot be empty')
+        return [non_empty_string_validator('Tag ID')(t) for t in v]
+
 class RFIDTagResponse(RFIDTagBase):
     # enrich response with optional assignment/unit info
     unit_id: Optional[str] = None
@@ -29,15 +39,27 @@ class RFIDTagResponse(RFIDTagBase):
 
 class PaginatedRFIDTagsResponse(BaseModel):
     tags: List[RFIDTagResponse]
-    total_tags: int
+    total_tags: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(cls, tags: List[RFIDTagResponse], total_count: int, page: int, page_size: int):
+    def create(cls, tags: List[RFIDTagResponse], total_count: Optional[int], page: int, page_size: int, next_cursor: Optional[str] = None, after: Optional[str] = None):
+        # keyset mode (after cursor) skips the count, so totals are left empty
+        if total_count is None:
+            return cls(
+                tags=tags,
+                page=page,
+                page_size=page_size,
+                has_next=next_cursor is not None,
+                has_previous=after is not None,
+                next_cursor=next_cursor
+            )
+
         total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
         
         return cls(
@@ -47,5 +69,6 @@ class PaginatedRFIDTagsResponse(BaseModel):
             page_size=page_size,
             total_pages=total_pages,
             has_next=page < total_pages,
-            has_previous=page > 1
+            has_previous=page > 1,
+            next_cursor=next_cursor
         )
\ No newline at end of file
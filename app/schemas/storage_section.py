@@ -62,9 +62,11 @@ class StorageSectionResponse(StorageSectionBase):
 
     @classmethod
     def model_validate(cls, obj):
-        # Compute in_use by checking references
-        db = getattr(obj, '_sa_instance_state', None)
-        # If obj is an ORM instance, check relationships
+        # listings query in_use as a column (crud.storage_section.with_in_use)
+        in_use = getattr(obj, 'in_use', None)
+        if in_use is not None:
+            return super().model_validate({**obj.__dict__, 'in_use': in_use})
+        # otherwise compute it by checking references
         in_use = False
         if hasattr(obj, 'containers') and obj.containers:
             in_use = True
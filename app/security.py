@@ -1,6 +1,7 @@
-from fastapi import HTTPException, status, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hmac
+import json
 import os
+from typing import Iterable, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,25 +9,56 @@ load_dotenv()
 # Get API key from environment
 API_KEY = os.getenv("CLIENT_API_KEY")
 
-# Create Bearer token security with auto_error=False
-bearer_scheme = HTTPBearer(auto_error=False)
 
-def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+def _bearer_token(headers) -> Optional[str]:
+    """Pull the Bearer token out of raw ASGI headers (same rules as fastapi's HTTPBearer)"""
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            token = token.strip()
+            if scheme.lower() != "bearer" or not token:
+                return None
+            return token
+    return None
+
+
+async def _unauthorized(send, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 401,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"www-authenticate", b"Bearer"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class APIKeyMiddleware:
     """
-    Verify API key as Bearer token
+    Verify API key as Bearer token on every HTTP request.
+    Pure ASGI: reads the header straight from the scope, no Request object or dependency resolution.
     """
-    if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header is required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if credentials.credentials != API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    return credentials.credentials
\ No newline at end of file
+
+    def __init__(self, app, api_key: Optional[str] = API_KEY, public_paths: Iterable[Optional[str]] = ()):
+        self.app = app
+        self.api_key = api_key.encode() if api_key else None
+        self.public_paths = frozenset(p for p in public_paths if p)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.public_paths:
+            await self.app(scope, receive, send)
+            return
+
+        token = _bearer_token(scope["headers"])
+        if token is None:
+            await _unauthorized(send, "Authorization header is required")
+            return
+        # constant-time compare; with no key configured every token is rejected
+        if self.api_key is None or not hmac.compare_digest(token.encode(), self.api_key):
+            await _unauthorized(send, "Invalid API key")
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,52 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Small thread-safe in-process cache whose entries expire after `ttl` seconds"""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # bumped by invalidate(); a value computed across an invalidation is returned but not stored
+        self._generation = 0
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], cache_none: bool = True) -> Any:
+        """
+        Return the cached value for `key`, computing and storing it with `factory` on a miss.
+        With cache_none=False a None result is handed back without being stored.
+        """
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            generation = self._generation
+
+        value = factory()
+        if value is None and not cache_none:
+            return value
+
+        with self._lock:
+            if generation != self._generation:
+                # the data may have changed while factory() was reading it
+                return value
+            if len(self._data) >= self.maxsize:
+                # drop expired entries first, then the oldest one if still full
+                self._data = {k: v for k, v in self._data.items() if v[0] > now}
+                if len(self._data) >= self.maxsize:
+                    self._data.pop(min(self._data, key=lambda k: self._data[k][0]))
+            self._data[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop one entry, or everything when no key is given"""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
@@ -0,0 +1,50 @@
+import json
+from functools import lru_cache
+from typing import Any, Mapping, Type, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+
+
+def construct_response(schema: Type[M], obj: Any) -> M:
+    """
+    Build a response model from an ORM object, row or dict without running validation.
+    Only for data read back from the database, which is already typed; fields the
+    object doesn't carry fall back to the schema defaults.
+    """
+    values = {}
+    # crud returns ORM objects, Rows, or already-shaped dicts (e.g. enriched RFID tag listings)
+    get = obj.get if isinstance(obj, Mapping) else lambda name, default: getattr(obj, name, default)
+    for name in schema.model_fields:
+        value = get(name, _MISSING)
+        if value is not _MISSING:
+            values[name] = value
+    return schema.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def serialized_response(response_type: Any, value: Any) -> Response:
+    """
+    Dump `value` to JSON once with `response_type`'s serializer and return the bytes.
+    FastAPI passes a Response through untouched, so the route's response_model (kept for the
+    OpenAPI schema) doesn't validate and serialize the constructed models a second time.
+    """
+    return Response(content=_adapter(response_type).dump_json(value, by_alias=True), media_type="application/json")
+
+
+class StaticJSON:
+    """JSON payload serialized once at import; each call returns a fresh Response over the same bytes"""
+
+    def __init__(self, payload: Any):
+        self.body = json.dumps(payload, separators=(",", ":")).encode()
+
+    def response(self) -> Response:
+        return Response(content=self.body, media_type="application/json")
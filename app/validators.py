@@ -1,3 +1,4 @@
+import re
 from typing import Optional
 
 def positive_int_validator(field_name: str = "Value"):
@@ -42,18 +43,25 @@ def boolean_validator(field_name: str = "Value"):
         return v
     return validator
 
+# ASCII digits only (str.isdigit also accepts e.g. '²', which int() rejects), and at most
+# STORAGE_NUMBER_DIGITS of them so StorageSection.generate_sort_key's zero padding keeps its order
+STORAGE_NUMBER_DIGITS = 5
+
+def _is_storage_format(prefix: str, v: str) -> bool:
+    return re.fullmatch(rf"{re.escape(prefix)}[0-9]{{1,{STORAGE_NUMBER_DIGITS}}}", v) is not None
+
 def storage_format_validator(prefix: str, field_name: str):
     def validator(v: str) -> str:
-        if not v.startswith(prefix) or not v[1:].isdigit():
-            raise ValueError(f'{field_name} must be in format {prefix}1, {prefix}2, {prefix}3, etc.')
+        if not _is_storage_format(prefix, v):
+            raise ValueError(f'{field_name} must be in format {prefix}1, {prefix}2, {prefix}3, etc. (at most {STORAGE_NUMBER_DIGITS} digits)')
         return v.upper()
     return validator
 
 def storage_format_optional_validator(prefix: str, field_name: str):
     def validator(v: Optional[str]) -> Optional[str]:
         if v is not None:
-            if not v.startswith(prefix) or not v[1:].isdigit():
-                raise ValueError(f'{field_name} must be in format {prefix}1, {prefix}2, {prefix}3, etc.')
+            if not _is_storage_format(prefix, v):
+                raise ValueError(f'{field_name} must be in format {prefix}1, {prefix}2, {prefix}3, etc. (at most {STORAGE_NUMBER_DIGITS} digits)')
             return v.upper()
         return v
     return validator